@@ -5,6 +5,7 @@ and mood mapping. Modify these values to customize genre categorization behavior
 """
 
 from enum import Enum
+from pathlib import Path
 
 
 # =============================================================================
@@ -33,6 +34,36 @@ class Mood(str, Enum):
     """Fallback mood category for genres that don't fit other categories."""
 
 
+MOOD_VALUES: tuple[str, ...] = tuple(mood.value for mood in Mood)
+"""Mood values in enum order, computed once at import."""
+
+MOOD_VALUE_SET: frozenset[str] = frozenset(MOOD_VALUES)
+"""Mood values for constant-time membership checks (e.g. validating LLM output)."""
+
+LLM_MOOD_VALUE_SET: frozenset[str] = MOOD_VALUE_SET - {Mood.OTHER.value}
+"""Moods the LLM is asked to choose from (every mood but the Other fallback); only these are cached."""
+
+
+# =============================================================================
+# LLM Categorization
+# =============================================================================
+
+GENRE_CATEGORIZATION_BATCH_SIZE = 20
+"""Maximum number of unknown genres sent to the LLM in a single sampling call."""
+
+GENRE_CATEGORIZATION_MAX_CONCURRENT = 8
+"""Maximum number of categorization batches sampled from the LLM at once."""
+
+MOOD_CACHE_PATH = Path.home() / ".cache" / "greenroom" / "moods.sqlite"
+"""Default location of the persistent cache of LLM mood classifications."""
+
+MOOD_CACHE_VERSION = 1
+"""Version of the LLM categorization prompt; bump it when the prompt or moods change so older cached answers are ignored."""
+
+MOOD_CACHE_TTL = 30 * 24 * 60 * 60.0
+"""Seconds a cached LLM mood classification is reused, so answers from an earlier model eventually expire."""
+
+
 # =============================================================================
 # Genre-to-Mood Mappings
 # =============================================================================
@@ -1,15 +1,19 @@
 """Standard data models for media representation."""
 
 from greenroom.models.media import Media, MediaList
+from greenroom.models.media_batch import MediaBatch
 from greenroom.models.genre import Genre, GenreList
 from greenroom.models.media_types import (
     MediaType,
+    MediaTypeCode,
     MEDIA_TYPE_FILM,
     MEDIA_TYPE_TELEVISION,
     MEDIA_TYPE_PODCAST,
     MEDIA_TYPE_BOOK,
     MEDIA_TYPE_MUSIC,
     MEDIA_TYPE_GAME,
+    MEDIA_TYPE_NAMES,
+    MEDIA_TYPE_CODES,
 )
 from greenroom.models.responses import (
     MediaResultDict,
@@ -22,15 +26,19 @@ from greenroom.models.responses import (
 __all__ = [
     "Media",
     "MediaList",
+    "MediaBatch",
     "Genre",
     "GenreList",
     "MediaType",
+    "MediaTypeCode",
     "MEDIA_TYPE_FILM",
     "MEDIA_TYPE_TELEVISION",
     "MEDIA_TYPE_PODCAST",
     "MEDIA_TYPE_BOOK",
     "MEDIA_TYPE_MUSIC",
     "MEDIA_TYPE_GAME",
+    "MEDIA_TYPE_NAMES",
+    "MEDIA_TYPE_CODES",
     "MediaResultDict",
     "DiscoveryResultDict",
     "GenrePropertiesDict",
@@ -3,12 +3,13 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Genre:
     """Standard genre representation, provider-agnostic.
 
     This model provides a normalized interface for genre data from any provider
     (TMDB, IMDb, OMDb, etc.), ensuring consistent field names and data types.
+    Instances are immutable and hashable, so they can be shared and cached safely.
     """
     id: int
     name: str
@@ -16,7 +17,7 @@ class Genre:
     has_tv_shows: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GenreList:
     """Standard genre list response.
 
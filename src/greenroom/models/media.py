@@ -8,12 +8,13 @@ from datetime import date
 from greenroom.models.media_types import MediaType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Media:
     """Standard media representation, provider-agnostic.
 
     This model provides a normalized interface for media data from any provider
     (TMDB, IMDb, OMDb, etc.), ensuring consistent field names and data types.
+    Instances are immutable; use dataclasses.replace() to derive a modified copy.
     """
     id: str                                 # Generic ID (could be int/string depending on provider)
     media_type: MediaType                   # Type-safe media type
@@ -24,7 +25,7 @@ class Media:
     genre_ids: list[int] | None = None   # List of genre IDs
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaList:
     """Standard paginated media list response.
 
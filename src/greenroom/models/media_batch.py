@@ -0,0 +1,88 @@
+"""Columnar (structure-of-arrays) representation of media results."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import date
+
+from greenroom.models.media import Media, MediaList
+from greenroom.models.media_types import MEDIA_TYPE_CODES, MEDIA_TYPE_NAMES
+
+# Sentinel for a missing date in the ordinal column (date.toordinal() starts at 1)
+_NO_DATE = 0
+
+
+@dataclass(slots=True)
+class MediaBatch:
+    """Columnar alternative to MediaList for bulk analytics over large pages.
+
+    Numeric, temporal and enum fields are stored in compact typed arrays so that
+    sorting and filtering walk contiguous buffers instead of one heap object per
+    result. Strings and genre lists stay in plain Python lists.
+
+    Missing values are encoded in-band: ratings as NaN, dates as ordinal 0.
+    """
+    ids: list[str]
+    titles: list[str]
+    media_types: array[int]                 # MediaTypeCode values ('B', uint8)
+    ratings: array[float]                   # Ratings ('d'), NaN when missing
+    dates: array[int]                       # date.toordinal() ('l'), 0 when missing
+    descriptions: list[str | None]
+    genre_ids: list[list[int] | None]
+    total_results: int
+    page: int
+    total_pages: int
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_media_list(cls, media_list: MediaList) -> MediaBatch:
+        """Build a batch from a MediaList, one column per Media field."""
+        results = media_list.results
+        return cls(
+            ids=[m.id for m in results],
+            titles=[m.title for m in results],
+            media_types=array("B", [MEDIA_TYPE_CODES[m.media_type] for m in results]),
+            ratings=array("d", [math.nan if m.rating is None else m.rating for m in results]),
+            dates=array("l", [_NO_DATE if m.date is None else m.date.toordinal() for m in results]),
+            descriptions=[m.description for m in results],
+            genre_ids=[m.genre_ids for m in results],
+            total_results=media_list.total_results,
+            page=media_list.page,
+            total_pages=media_list.total_pages,
+        )
+
+    def to_media_list(self) -> MediaList:
+        """Rebuild the equivalent MediaList (round-trips from_media_list)."""
+        results = [
+            Media(
+                id=media_id,
+                media_type=MEDIA_TYPE_NAMES[code],
+                title=title,
+                date=None if ordinal == _NO_DATE else date.fromordinal(ordinal),
+                rating=None if math.isnan(rating) else rating,
+                description=description,
+                genre_ids=genre_ids,
+            )
+            for media_id, code, title, ordinal, rating, description, genre_ids in zip(
+                self.ids, self.media_types, self.titles, self.dates,
+                self.ratings, self.descriptions, self.genre_ids,
+            )
+        ]
+        return MediaList(
+            results=results,
+            total_results=self.total_results,
+            page=self.page,
+            total_pages=self.total_pages,
+        )
+
+    def order_by_rating(self, descending: bool = True) -> list[int]:
+        """Return row indices sorted by rating; rows without a rating sort last."""
+        ratings = self.ratings
+        rated = [i for i in range(len(ratings)) if not math.isnan(ratings[i])]
+        rated.sort(key=ratings.__getitem__, reverse=descending)
+        unrated = [i for i in range(len(ratings)) if math.isnan(ratings[i])]
+        return rated + unrated
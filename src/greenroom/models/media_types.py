@@ -1,5 +1,6 @@
 """Media type constants and type definitions."""
 
+from enum import IntEnum
 from typing import Final, Literal
 
 # String constants for media types
@@ -24,8 +25,38 @@ MediaType = Literal[
     "game",
 ]
 
+
+class MediaTypeCode(IntEnum):
+    """Compact integer codes for media types.
+
+    Used where media types are stored in bulk (e.g. the uint8 column of a
+    MediaBatch) and compared as ints rather than strings. Values index into
+    MEDIA_TYPE_NAMES, so never reorder existing members.
+    """
+    FILM = 0
+    TELEVISION = 1
+    PODCAST = 2
+    BOOK = 3
+    MUSIC = 4
+    GAME = 5
+
+
+# Lookup tables between codes and the string constants above
+MEDIA_TYPE_NAMES: Final[tuple[MediaType, ...]] = (
+    MEDIA_TYPE_FILM,
+    MEDIA_TYPE_TELEVISION,
+    MEDIA_TYPE_PODCAST,
+    MEDIA_TYPE_BOOK,
+    MEDIA_TYPE_MUSIC,
+    MEDIA_TYPE_GAME,
+)
+MEDIA_TYPE_CODES: Final[dict[str, MediaTypeCode]] = {
+    name: MediaTypeCode(code) for code, name in enumerate(MEDIA_TYPE_NAMES)
+}
+
 # To add a new media type in the future:
 # 1. Add a constant: MEDIA_TYPE_XXXXX = "xxxxx"
 # 2. Add the string to the MediaType Literal union above
-# 3. Add config to specific service's config_map if that service supports it
-# 4. Create corresponding MCP tool (e.g., discover_xxxxx) if needed
+# 3. Append a member to MediaTypeCode and the constant to MEDIA_TYPE_NAMES
+# 4. Add config to specific service's config map (e.g. TMDB_MEDIA_CONFIGS) if that service supports it
+# 5. Create corresponding MCP tool (e.g., discover_xxxxx) if needed
@@ -1,15 +1,43 @@
 """FastMCP server providing example tools and resources."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from greenroom.services.llm import LLMService
+from greenroom.services.mood_cache import create_mood_cache
+from greenroom.services.tmdb import TMDBService
 from greenroom.tools import register_all_tools
 
 # Load environment variables
 load_dotenv()
 
+# Long-lived services shared by the tools so pooled connections and caches persist across calls
+media_service = TMDBService()
+llm_service = LLMService()
+# The mood cache is only created here; its file is opened on server startup, not at import
+mood_cache = create_mood_cache()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Open the mood cache on startup; close it and pooled HTTP connections on shutdown."""
+    if mood_cache is not None:
+        await asyncio.to_thread(mood_cache.open)
+    try:
+        yield
+    finally:
+        await media_service.aclose()
+        await llm_service.aclose()
+        if mood_cache is not None:
+            mood_cache.close()
+
+
 # Create FastMCP instance
-mcp = FastMCP("greenroom")
+mcp = FastMCP("greenroom", lifespan=lifespan)
 
 @mcp.resource("config://version")
 def get_version() -> str:
@@ -17,7 +45,7 @@ def get_version() -> str:
     return "0.1.0"
 
 # Register all tools
-register_all_tools(mcp)
+register_all_tools(mcp, media_service, llm_service, mood_cache)
 
 def main() -> None:
     """Run the MCP server."""
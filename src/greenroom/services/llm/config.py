@@ -8,3 +8,15 @@ OLLAMA_DEFAULT_MODEL = "llama3.2:latest"
 
 OLLAMA_TIMEOUT = 30.0
 """Timeout in seconds for Ollama API requests."""
+
+OLLAMA_CONNECT_TIMEOUT = 5.0
+"""Timeout in seconds for establishing a connection to the Ollama server (fails fast when it is down)."""
+
+OLLAMA_MAX_CONNECTIONS = 32
+"""Maximum number of concurrent connections in the Ollama client pool."""
+
+OLLAMA_MAX_KEEPALIVE_CONNECTIONS = 16
+"""Maximum number of idle connections kept open for reuse by the Ollama client."""
+
+OLLAMA_MAX_CONCURRENT_REQUESTS = 5
+"""Default cap on in-flight generate requests in a batch, so a local Ollama server is not overloaded."""
@@ -1,12 +1,22 @@
 """Ollama API HTTP client."""
 
+import asyncio
 import os
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
+import orjson
 
-from greenroom.exceptions import APIConnectionError, APIResponseError, APITypeError, GreenroomError
-from greenroom.services.llm.config import OLLAMA_BASE_URL, OLLAMA_TIMEOUT
+from greenroom.exceptions import APIConnectionError, APIResponseError, APITypeError
+from greenroom.services.llm.config import (
+    OLLAMA_BASE_URL,
+    OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_MAX_CONCURRENT_REQUESTS,
+    OLLAMA_MAX_CONNECTIONS,
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+    OLLAMA_TIMEOUT,
+)
 
 
 class OllamaClient:
@@ -18,6 +28,33 @@ class OllamaClient:
 
     SERVICE_NAME = "Ollama"
 
+    def __init__(self) -> None:
+        """Initialize the client with a pooled HTTP connection.
+
+        The underlying httpx client is reused across generate() calls so that
+        steady-state requests skip connection setup. Call aclose() when done.
+        The base URL is resolved from OLLAMA_BASE_URL once, at construction.
+        """
+        self.base_url = os.getenv("OLLAMA_BASE_URL", OLLAMA_BASE_URL)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(OLLAMA_TIMEOUT, connect=OLLAMA_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "OllamaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def generate(
         self,
         prompt: str,
@@ -38,31 +75,28 @@ class OllamaClient:
 
         Raises:
             APITypeError: If response has unexpected Python type
-            APIResponseError: If Ollama API returns an HTTP error
+            APIResponseError: If Ollama API returns an HTTP error or invalid JSON
             APIConnectionError: If unable to connect to Ollama API
         """
-        base_url = os.getenv("OLLAMA_BASE_URL", OLLAMA_BASE_URL)
-
         try:
-            async with httpx.AsyncClient(timeout=OLLAMA_TIMEOUT) as client:
-                response = await client.post(
-                    f"{base_url}/api/generate",
-                    json={
-                        "model": model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": temperature,
-                            "num_predict": max_tokens
-                        }
+            response = await self._client.post(
+                "/api/generate",
+                json={
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": max_tokens
                     }
-                )
-                response.raise_for_status()
+                }
+            )
+            response.raise_for_status()
 
-                result = response.json()
-                if not isinstance(result, dict):
-                    raise APITypeError(f"{self.SERVICE_NAME} API returned unexpected type: {type(result)}")
-                return result
+            result = orjson.loads(response.content)
+            if not isinstance(result, dict):
+                raise APITypeError(f"{self.SERVICE_NAME} API returned unexpected type: {type(result)}")
+            return result
 
         except httpx.HTTPStatusError as e:
             raise APIResponseError(
@@ -70,10 +104,44 @@ class OllamaClient:
             ) from e
         except httpx.RequestError as e:
             raise APIConnectionError(
-                f"Failed to connect to {self.SERVICE_NAME} API at {base_url}. "
+                f"Failed to connect to {self.SERVICE_NAME} API at {self.base_url}. "
                 f"Is the {self.SERVICE_NAME} server running? Error: {str(e)}"
             ) from e
-        except GreenroomError:
-            raise
-        except Exception as e:
-            raise APIResponseError(f"{self.SERVICE_NAME} error: {str(e)}") from e
+        except orjson.JSONDecodeError as e:
+            raise APIResponseError(
+                f"{self.SERVICE_NAME} API returned invalid JSON: {str(e)}"
+            ) from e
+
+    async def batch_generate(
+        self,
+        prompts: Sequence[str],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        max_concurrent: int = OLLAMA_MAX_CONCURRENT_REQUESTS
+    ) -> list[dict[str, Any] | BaseException]:
+        """Make generate requests for several prompts concurrently.
+
+        At most max_concurrent requests are in flight at once. A failed request
+        does not cancel the others; its exception is returned in its slot.
+
+        Args:
+            prompts: The prompts to send
+            model: Ollama model name
+            temperature: Temperature setting
+            max_tokens: Maximum tokens to generate per prompt
+            max_concurrent: Maximum number of concurrent requests
+
+        Returns:
+            One parsed JSON response or exception per prompt, in prompt order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate_one(prompt: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.generate(prompt, model, temperature, max_tokens)
+
+        return await asyncio.gather(
+            *(generate_one(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
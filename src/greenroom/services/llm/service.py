@@ -1,10 +1,13 @@
 """Service layer for LLM interactions."""
 
+import asyncio
+from collections.abc import Sequence
+
 from fastmcp import Context
 
 from greenroom.exceptions import GreenroomError, SamplingError
 from greenroom.services.llm.ollama_client import OllamaClient
-from greenroom.services.llm.config import OLLAMA_DEFAULT_MODEL
+from greenroom.services.llm.config import OLLAMA_DEFAULT_MODEL, OLLAMA_MAX_CONCURRENT_REQUESTS
 from greenroom.services.protocols import LLMClient
 
 
@@ -21,6 +24,10 @@ class LLMService:
         """Initialize the LLM service."""
         self.client: LLMClient = client or OllamaClient()
 
+    async def aclose(self) -> None:
+        """Close the underlying LLM client and its pooled connections."""
+        await self.client.aclose()
+
     async def resample_current_llm(
         self,
         ctx: Context,
@@ -50,9 +57,10 @@ class LLMService:
                 max_tokens=max_tokens
             )
 
-            if not hasattr(response, "text"):
+            text: str | None = getattr(response, "text", None)
+            if text is None:
                 raise SamplingError(f"{self.SAMPLING_SOURCE} API returned unexpected content type: {type(response)}")
-            return response.text
+            return text
         except GreenroomError:
             raise
         except Exception as e:
@@ -88,3 +96,39 @@ class LLMService:
         # data is a Dict whose values can be Any. Assigning to str before calling data.get() makes the type explicit.
         result: str = data.get("response", "")
         return result
+
+    async def batch_generate_from_alternative_llm(
+        self,
+        prompts: Sequence[str],
+        temperature: float,
+        max_tokens: int,
+        max_concurrent: int = OLLAMA_MAX_CONCURRENT_REQUESTS
+    ) -> list[str | BaseException]:
+        """Call a different LLM client for several prompts concurrently.
+
+        Fans out over the client's generate() with at most max_concurrent
+        requests in flight, so it works with any LLMClient, and extracts the
+        response text of each result. A failed prompt does not cancel the others.
+
+        Args:
+            prompts: The prompts to send
+            temperature: Temperature setting
+            max_tokens: Maximum tokens to generate per prompt
+            max_concurrent: Maximum number of concurrent requests
+
+        Returns:
+            One response text per prompt, in prompt order; failed prompts hold
+            their exception (APIResponseError, APIConnectionError, ...) instead
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                data = await self.client.generate(prompt, OLLAMA_DEFAULT_MODEL, temperature, max_tokens)
+            result: str = data.get("response", "")
+            return result
+
+        return await asyncio.gather(
+            *(generate_one(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
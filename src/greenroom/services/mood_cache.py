@@ -0,0 +1,126 @@
+"""Persistent cache of LLM genre-to-mood classifications."""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from greenroom.config import MOOD_CACHE_PATH, MOOD_CACHE_TTL, MOOD_CACHE_VERSION
+
+
+class MoodCache:
+    """SQLite-backed mapping from genre name to mood value.
+
+    Genre names are normalized (stripped and lowercased), so lookups ignore
+    case and surrounding whitespace. Each entry records the prompt version it
+    was classified under and when it was stored; entries from another version
+    or older than the ttl count as misses and are replaced on the next write.
+
+    The cache is best-effort: until open() succeeds, and on any database
+    error, lookups miss and writes are dropped, so a broken cache file never
+    blocks categorization. Access is guarded by a lock so one cache can be
+    shared across threads; the methods do blocking I/O, so async callers
+    should run them via asyncio.to_thread().
+    """
+
+    def __init__(self, path: Path | str, version: int = MOOD_CACHE_VERSION, ttl: float = MOOD_CACHE_TTL):
+        """Initialize the cache without touching the filesystem.
+
+        Args:
+            path: Location of the SQLite file; created (with parent directories) by open()
+            version: Categorization prompt version; only entries stored under it are returned
+            ttl: Seconds an entry is reused after it was stored
+        """
+        self.path = Path(path)
+        self.version = version
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> bool:
+        """Create (if needed) and connect to the cache database.
+
+        Returns:
+            True if the cache is ready; False if it could not be opened, in which
+            case it stays disabled
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS moods ("
+                "genre TEXT PRIMARY KEY, mood TEXT NOT NULL, version INTEGER NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            return False
+
+        with self._lock:
+            # Reopening replaces the connection; close the old one instead of leaking it
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = conn
+        return True
+
+    @staticmethod
+    def _key(genre_name: str) -> str:
+        return genre_name.strip().lower()
+
+    def get_many(self, genre_names: Iterable[str]) -> dict[str, str]:
+        """Return cached moods for the given genres, keyed by the names as passed in."""
+        names_by_key: dict[str, list[str]] = {}
+        for genre_name in genre_names:
+            names_by_key.setdefault(self._key(genre_name), []).append(genre_name)
+        if not names_by_key:
+            return {}
+
+        placeholders = ",".join("?" * len(names_by_key))
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return {}
+                rows = self._conn.execute(
+                    f"SELECT genre, mood FROM moods WHERE genre IN ({placeholders}) AND version = ? AND stored_at > ?",
+                    (*names_by_key, self.version, time.time() - self.ttl)
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+
+        return {genre_name: mood for key, mood in rows for genre_name in names_by_key[key]}
+
+    def set_many(self, moods: Mapping[str, str]) -> None:
+        """Store a mood for each genre, replacing any existing entries."""
+        if not moods:
+            return
+        stored_at = time.time()
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO moods (genre, mood, version, stored_at) VALUES (?, ?, ?, ?)",
+                    [(self._key(genre_name), mood, self.version, stored_at) for genre_name, mood in moods.items()]
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the database connection; the cache is disabled until reopened."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_mood_cache() -> MoodCache | None:
+    """Create the mood cache configured by the environment, without opening it.
+
+    GREENROOM_MOOD_CACHE_PATH overrides the default location. Returns None when
+    GREENROOM_NO_MOOD_CACHE=1. Call open() (e.g. on server startup) before use.
+    """
+    if os.getenv("GREENROOM_NO_MOOD_CACHE") == "1":
+        return None
+    return MoodCache(os.getenv("GREENROOM_MOOD_CACHE_PATH", MOOD_CACHE_PATH))
@@ -41,6 +41,10 @@ class LLMClient(Protocol):
         """
         ...
 
+    async def aclose(self) -> None:
+        """Release any resources (e.g. pooled connections) held by the client."""
+        ...
+
 
 @runtime_checkable
 class MediaService(Protocol):
@@ -1,11 +1,13 @@
 """TMDB API HTTP client."""
 
-import json
 import os
 import httpx
+import orjson
 from typing import Any
 
 from greenroom.exceptions import APIConnectionError, APIResponseError, APITypeError
+from greenroom.services.tmdb.cache import TTLCache
+from greenroom.services.tmdb.config import TMDB_CACHE_MAXSIZE, TMDB_ERROR_BODY_LIMIT, TMDB_GENRES_CACHE_TTL
 
 
 class TMDBClient:
@@ -32,48 +34,91 @@ class TMDBClient:
                 "Get your key from https://www.themoviedb.org/settings/api"
             )
 
-    async def get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        # One pooled client per instance so repeated requests reuse connections; the
+        # API key is a default query parameter, merged into every request by httpx
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=10.0,
+            headers={"accept": "application/json"},
+            params={"api_key": self.api_key},
+            http2=True,  # Multiplex concurrent requests (e.g. both genre lists) on one connection
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+        # Successful responses of requests made with a ttl, keyed by (endpoint, params),
+        # excluding the API key; every caller passes its own ttl
+        self._cache: TTLCache[dict[str, Any]] = TTLCache(maxsize=TMDB_CACHE_MAXSIZE, ttl=TMDB_GENRES_CACHE_TTL)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "TMDBClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        ttl: float | None = None,
+        refresh: bool = False
+    ) -> dict[str, Any]:
         """Make a GET request to TMDB API.
 
+        Caching is opt-in: when ttl is given, the successful response is cached per
+        (endpoint, params) and repeated identical requests within the TTL are served
+        without a network call. Requests without a ttl (e.g. discover queries, whose
+        results change quickly) always hit the API.
+
         Args:
             endpoint: API endpoint (e.g., "/discover/movie")
-            params: Query parameters (API key will be added automatically)
+            params: Query parameters (API key is added by the client, not written into params)
+            ttl: Optional cache lifetime in seconds; the response is only cached if given
+            refresh: If True, skip any cached response and re-cache the fresh one
 
         Returns:
-            Parsed JSON response as a dictionary
+            Parsed JSON response as a dictionary (shared with the cache; do not mutate)
 
         Raises:
             APITypeError: If response has unexpected Python type
             APIResponseError: If TMDB API returns an HTTP error or invalid JSON
             APIConnectionError: If unable to connect to TMDB API
         """
-        # Add API key to parameters
-        params["api_key"] = self.api_key
-        headers = {"accept": "application/json"}
+        cache_key: tuple[str, tuple[tuple[str, Any], ...]] | None = None
+        if ttl is not None:
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            if not refresh:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}{endpoint}",
-                    params=params,
-                    headers=headers
-                )
-                response.raise_for_status()
-
-            result = response.json()
-            if not isinstance(result, dict):
-                raise APITypeError(f"{self.SERVICE_NAME} API returned unexpected type: {type(result)}")
-            return result
-
-        except httpx.HTTPStatusError as e:
-            raise APIResponseError(
-                f"{self.SERVICE_NAME} API error: {e.response.status_code} - {e.response.text}"
-            ) from e
+            response = await self._client.get(endpoint, params=params)
         except httpx.RequestError as e:
             raise APIConnectionError(
                 f"Failed to connect to {self.SERVICE_NAME} API: {str(e)}"
             ) from e
-        except json.JSONDecodeError as e:
+
+        # Check the status inline rather than raising and re-wrapping httpx.HTTPStatusError;
+        # only a bounded prefix of the body is decoded into the message
+        if not response.is_success:
+            body_preview = response.content[:TMDB_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+            raise APIResponseError(
+                f"{self.SERVICE_NAME} API error: {response.status_code} - {body_preview}"
+            )
+
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise APIResponseError(
                 f"{self.SERVICE_NAME} API returned invalid JSON: {str(e)}"
             ) from e
+
+        if not isinstance(result, dict):
+            raise APITypeError(f"{self.SERVICE_NAME} API returned unexpected type: {type(result)}")
+        if cache_key is not None:
+            self._cache.set(cache_key, result, ttl)
+        return result
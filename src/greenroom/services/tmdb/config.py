@@ -1,11 +1,15 @@
 """TMDB-specific configuration for media types."""
 
-from dataclasses import dataclass
-from typing import Type
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Type
 from pydantic import BaseModel
 
+from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION, MediaType
+from greenroom.services.tmdb.models import TMDBFilm, TMDBTelevision
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TMDBMediaConfig:
     """TMDB-specific configuration for a media type.
 
@@ -19,9 +23,37 @@ class TMDBMediaConfig:
     date_sort_prefix: str         # Sort parameter prefix: "release_date" or "first_air_date"
     model_class: Type[BaseModel]  # Pydantic model for validation: TMDBFilm or TMDBTVShow
 
+    # Derived once from the fields above instead of formatted/looked up per request or item
+    discover_path: str = field(init=False, repr=False)  # "/discover/movie" or "/discover/tv"
+    title_getter: Callable[[Any], Any] = field(init=False, repr=False)
+    date_getter: Callable[[Any], Any] = field(init=False, repr=False)
 
-# Import models here to avoid circular import
-from greenroom.services.tmdb.models import TMDBFilm, TMDBTelevision
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "discover_path", f"/discover/{self.endpoint}")
+        object.__setattr__(self, "title_getter", attrgetter(self.title_field))
+        object.__setattr__(self, "date_getter", attrgetter(self.date_field))
+
+
+TMDB_CACHE_MAXSIZE = 512
+"""Maximum number of distinct TMDB API responses (endpoint + params) kept in the cache.
+
+Only requests made with a ttl (the genre lists) are cached; discover results change
+too quickly to reuse.
+"""
+
+TMDB_GENRES_CACHE_TTL = 86400.0
+"""Seconds a fetched genre list is reused; genres change far less often than discover results."""
+
+TMDB_ERROR_BODY_LIMIT = 256
+"""Maximum number of response-body bytes quoted in TMDB error messages (outage pages can be large HTML)."""
+
+TMDB_DISCOVER_BASE_PARAMS: dict[str, Any] = {
+    "sort_by": "popularity.desc",
+    "include_adult": False,  # Exclude pornographic content
+    "include_video": False,  # Exclude video-only content
+}
+"""Query parameters sent with every discover request; copied per request, never mutated."""
 
 
 TMDB_FILM_CONFIG = TMDBMediaConfig(
@@ -42,3 +74,10 @@ TMDB_TELEVISION_CONFIG = TMDBMediaConfig(
     date_sort_prefix="first_air_date",
     model_class=TMDBTelevision
 )
+
+
+# Dispatch table from standard media type to its TMDB config, built once at import
+TMDB_MEDIA_CONFIGS: dict[MediaType, TMDBMediaConfig] = {
+    MEDIA_TYPE_FILM: TMDB_FILM_CONFIG,
+    MEDIA_TYPE_TELEVISION: TMDB_TELEVISION_CONFIG,
+}
@@ -1,6 +1,10 @@
 """TMDB-specific response models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Shared by all TMDB models: payloads are read-only once parsed, and TMDB sends many
+# fields we do not map (popularity, poster_path, ...), which are dropped
+TMDB_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class TMDBGenre(BaseModel):
@@ -8,15 +12,23 @@ class TMDBGenre(BaseModel):
 
     Matches the structure returned by TMDB API for genre data.
     """
+    model_config = TMDB_MODEL_CONFIG
+
     id: int
     name: str
 
 
+# Validates a whole genre list in one pydantic-core call; built once at import
+TMDB_GENRE_LIST_ADAPTER: TypeAdapter[list[TMDBGenre]] = TypeAdapter(list[TMDBGenre])
+
+
 class TMDBFilm(BaseModel):
     """TMDB film response structure.
 
     Matches the structure returned by TMDB API for film data.
     """
+    model_config = TMDB_MODEL_CONFIG
+
     id: int
     title: str | None = None
     release_date: str | None = None
@@ -29,6 +41,8 @@ class TMDBTelevision(BaseModel):
 
     Matches the structure returned by TMDB API for television data.
     """
+    model_config = TMDB_MODEL_CONFIG
+
     id: int
     name: str | None = None
     first_air_date: str | None = None
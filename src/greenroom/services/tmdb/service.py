@@ -1,7 +1,9 @@
 """Service layer that encapsulates provider-specific logic."""
 
 import asyncio
+from collections.abc import Iterator
 from datetime import date
+from itertools import islice
 from typing import Any
 from pydantic import ValidationError
 
@@ -9,8 +11,13 @@ from greenroom.models.media import Media, MediaList
 from greenroom.models.genre import Genre, GenreList
 from greenroom.models.media_types import MediaType
 from greenroom.services.tmdb.client import TMDBClient
-from greenroom.services.tmdb.config import TMDB_FILM_CONFIG, TMDB_TELEVISION_CONFIG, TMDBMediaConfig
-from greenroom.services.tmdb.models import TMDBGenre
+from greenroom.services.tmdb.config import (
+    TMDB_DISCOVER_BASE_PARAMS,
+    TMDB_GENRES_CACHE_TTL,
+    TMDB_MEDIA_CONFIGS,
+    TMDBMediaConfig,
+)
+from greenroom.services.tmdb.models import TMDB_GENRE_LIST_ADAPTER, TMDBGenre
 
 
 class TMDBService:
@@ -23,10 +30,17 @@ class TMDBService:
     def __init__(self):
         """Initialize the TMDB service."""
         self.client = TMDBClient()
-        self.config_map = {
-            "film": TMDB_FILM_CONFIG,
-            "television": TMDB_TELEVISION_CONFIG
-        }
+        self.config_map = TMDB_MEDIA_CONFIGS
+
+    async def aclose(self) -> None:
+        """Close the underlying TMDB client and its pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "TMDBService":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def get_provider_name(self) -> str:
         """Return the name of this provider."""
@@ -74,19 +88,16 @@ class TMDBService:
         params = self._build_params(config, genre_id, year, language, sort_by, page)
 
         # Call TMDB API
-        endpoint = f"/discover/{config.endpoint}"
-        data = await self.client.get(endpoint, params)
+        data = await self.client.get(config.discover_path, params)
 
-        # Parse and transform response
+        # Parse, transform and apply max_results limit in a single lazy pass, so
+        # items beyond the limit are never built
         tmdb_items = self._parse_response(data["results"], config)
-        standard_items = [
+        limited_items = [
             self._to_standard_media(item, config, media_type)
-            for item in tmdb_items
+            for item in islice(tmdb_items, max_results)
         ]
 
-        # Apply max_results limit
-        limited_items = standard_items[:max_results]
-
         # Return standardized response
         return MediaList(
             results=limited_items,
@@ -103,7 +114,7 @@ class TMDBService:
         language: str | None,
         sort_by: str | None,
         page: int
-    ) -> dict:
+    ) -> dict[str, Any]:
         """Build TMDB-specific query parameters.
 
         Args:
@@ -117,12 +128,11 @@ class TMDBService:
         Returns:
             Dictionary of TMDB query parameters
         """
-        params = {
-            "sort_by": sort_by if sort_by is not None else "popularity.desc",
-            "page": page,
-            "include_adult": False, # Exclude pornographic content
-            "include_video": False  # Exclude video-only content
-        }
+        params = TMDB_DISCOVER_BASE_PARAMS.copy()
+        params["page"] = page
+
+        if sort_by is not None:
+            params["sort_by"] = sort_by
 
         if genre_id is not None:
             params["with_genres"] = genre_id
@@ -135,24 +145,31 @@ class TMDBService:
 
         return params
 
-    def _parse_response(self, raw_results: list, config: TMDBMediaConfig) -> list:
+    def _parse_response(self, raw_results: list, config: TMDBMediaConfig) -> Iterator[Any]:
         """Parse TMDB response using Pydantic models.
 
+        Items are validated lazily as they are consumed, so items beyond the
+        caller's limit are never validated. Items without an integer id are
+        dropped before validation; items that otherwise don't match the schema
+        (e.g. wrong-typed fields) are skipped.
+
         Args:
             raw_results: Raw results array from TMDB API
             config: TMDB media configuration with model class
 
         Returns:
-            List of validated Pydantic model instances
+            Lazy iterator of validated Pydantic model instances
         """
-        valid_items = []
+        model_class = config.model_class
         for item_data in raw_results:
+            # Cheap pre-filter so rows without an id never cost a ValidationError
+            if not isinstance(item_data.get("id"), int):
+                continue
             try:
-                valid_items.append(config.model_class(**item_data))
+                yield model_class.model_validate(item_data)
             except ValidationError:
-                # Skip items that don't match the schema (missing required fields)
-                pass
-        return valid_items
+                # Skip items that don't match the schema
+                continue
 
     def _to_standard_media(
         self,
@@ -173,8 +190,8 @@ class TMDBService:
         return Media(
             id=str(tmdb_item.id),
             media_type=media_type,
-            title=getattr(tmdb_item, config.title_field, None) or "",
-            date=self._parse_date(getattr(tmdb_item, config.date_field, None)),
+            title=config.title_getter(tmdb_item) or "",
+            date=self._parse_date(config.date_getter(tmdb_item)),
             rating=tmdb_item.vote_average,
             description=tmdb_item.overview,
             genre_ids=tmdb_item.genre_ids or []
@@ -200,9 +217,15 @@ class TMDBService:
     # Retrieve categorization information
     # =============================================================================
 
-    async def get_genres(self) -> GenreList:
+    async def get_genres(self, force_refresh: bool = False) -> GenreList:
         """Fetch all genres from TMDB for films and TV shows.
 
+        Both genre list responses are cached by the client for TMDB_GENRES_CACHE_TTL
+        seconds, so repeated calls within that window do not hit the API.
+
+        Args:
+            force_refresh: If True, bypass the cached responses and refetch both genre lists
+
         Returns:
             GenreList with standardized Genre objects including media type availability
 
@@ -213,8 +236,8 @@ class TMDBService:
 
         # Concurrently fetch genres for films and television
         film_data, tv_data = await asyncio.gather(
-            self.client.get("/genre/movie/list", {}),
-            self.client.get("/genre/tv/list", {})
+            self.client.get("/genre/movie/list", {}, ttl=TMDB_GENRES_CACHE_TTL, refresh=force_refresh),
+            self.client.get("/genre/tv/list", {}, ttl=TMDB_GENRES_CACHE_TTL, refresh=force_refresh)
         )
 
         # Parse and validate genre data
@@ -224,23 +247,30 @@ class TMDBService:
         # Combine into unified GenreList
         return self._combine_genre_lists(film_genres, tv_genres)
 
-    def _parse_genres(self, raw_genres: list[dict[str, Any]]) -> list[TMDBGenre]:
+    def _parse_genres(self, raw_genres: Any) -> list[TMDBGenre]:
         """Parse TMDB genre response using Pydantic validation.
 
         Args:
-            raw_genres: Raw genre data from TMDB API
+            raw_genres: Raw genre data from TMDB API (expected to be a list)
 
         Returns:
-            List of validated TMDBGenre models (invalid entries are silently skipped)
+            List of validated TMDBGenre models (invalid entries are silently skipped;
+            a payload that is not a list, e.g. null, yields no genres)
         """
-        valid_genres = []
-        for genre in raw_genres:
-            try:
-                valid_genres.append(TMDBGenre(**genre))
-            except ValidationError:
-                # Skip invalid genre entries
-                pass
-        return valid_genres
+        if not isinstance(raw_genres, list):
+            return []
+
+        try:
+            # Common case: validate the whole list in a single call
+            return TMDB_GENRE_LIST_ADAPTER.validate_python(raw_genres)
+        except ValidationError as e:
+            # The error reports every failing list index, so drop those entries and
+            # validate the rest in one more call instead of retrying item by item
+            invalid_indexes = {error["loc"][0] for error in e.errors()}
+
+        return TMDB_GENRE_LIST_ADAPTER.validate_python(
+            [genre for index, genre in enumerate(raw_genres) if index not in invalid_indexes]
+        )
 
     def _combine_genre_lists(
         self,
@@ -256,30 +286,21 @@ class TMDBService:
         Returns:
             GenreList with Genre objects including media type availability flags
         """
-        # Build a map by genre name for deduplication
-        genres_map: dict[str, Genre] = {}
-
-        # Add film genres
-        for tmdb_genre in film_genres:
-            genres_map[tmdb_genre.name] = Genre(
-                id=tmdb_genre.id,
+        # Index by TMDB genre id; ids are shared between the film and TV lists
+        film_by_id = {tmdb_genre.id: tmdb_genre for tmdb_genre in film_genres}
+        tv_by_id = {tmdb_genre.id: tmdb_genre for tmdb_genre in tv_genres}
+
+        # Film genres first, then TV-only genres, each in TMDB's order
+        merged = dict(film_by_id)
+        for genre_id, tmdb_genre in tv_by_id.items():
+            merged.setdefault(genre_id, tmdb_genre)
+
+        return GenreList(genres=[
+            Genre(
+                id=genre_id,
                 name=tmdb_genre.name,
-                has_films=True,
-                has_tv_shows=False
+                has_films=genre_id in film_by_id,
+                has_tv_shows=genre_id in tv_by_id
             )
-
-        # Add or update with TV genres
-        for tmdb_genre in tv_genres:
-            if tmdb_genre.name in genres_map:
-                # Genre exists for films, mark as also available for TV
-                genres_map[tmdb_genre.name].has_tv_shows = True
-            else:
-                # TV-only genre
-                genres_map[tmdb_genre.name] = Genre(
-                    id=tmdb_genre.id,
-                    name=tmdb_genre.name,
-                    has_films=False,
-                    has_tv_shows=True
-                )
-
-        return GenreList(genres=list(genres_map.values()))
+            for genre_id, tmdb_genre in merged.items()
+        ])
@@ -2,16 +2,33 @@
 
 from fastmcp import FastMCP
 
+from greenroom.services.llm import LLMService
+from greenroom.services.mood_cache import MoodCache
+from greenroom.services.protocols import MediaService
 from greenroom.tools.genre_tools import register_genre_tools
 from greenroom.tools.agent_tools import register_agent_tools
 from greenroom.tools.discovery_tools import register_discovery_tools
 
 
-def register_all_tools(mcp: FastMCP) -> None:
-    """Register all tools with the MCP server."""
-    register_genre_tools(mcp)
-    register_agent_tools(mcp)
-    register_discovery_tools(mcp)
+def register_all_tools(
+    mcp: FastMCP,
+    media_service: MediaService,
+    llm_service: LLMService,
+    mood_cache: MoodCache | None = None
+) -> None:
+    """Register all tools with the MCP server.
+
+    The services are shared by every tool; the caller owns them and closes them on shutdown.
+
+    Args:
+        mcp: The FastMCP server to register tools with
+        media_service: Shared media provider used by the genre and discovery tools
+        llm_service: Shared LLM service used by the agent tools
+        mood_cache: Optional persistent cache of LLM genre mood classifications
+    """
+    register_genre_tools(mcp, media_service, mood_cache)
+    register_agent_tools(mcp, llm_service)
+    register_discovery_tools(mcp, media_service)
 
 
 __all__ = ["register_all_tools"]
@@ -2,18 +2,16 @@
 
 import asyncio
 
-from greenroom.models.responses import LLMComparisonResultDict, LLMResponseEntryDict
+from greenroom.models.responses import LLMComparisonResultDict
 
 from fastmcp import FastMCP, Context
 
 from greenroom.services.llm import LLMService
 
 
-def register_agent_tools(mcp: FastMCP) -> None:
+def register_agent_tools(mcp: FastMCP, service: LLMService) -> None:
     """Register agent comparison tools with the MCP server."""
 
-    service = LLMService()
-
     @mcp.tool()
     async def compare_llm_responses(
         ctx: Context,
@@ -95,14 +93,12 @@ def _format_responses(
 ) -> LLMComparisonResultDict:
     """Format labeled LLM responses into a structured comparison result."""
 
-    combined_response: LLMComparisonResultDict = { "prompt": prompt, "responses": [] }
-
-    for label, response in labeled_responses:
-        if isinstance(response, BaseException):
-            entry: LLMResponseEntryDict = {"source": label, "text": None, "error": str(response), "length": 0}
-        else:
-            entry = {"source": label, "text": response, "error": None, "length": len(response)}
-
-        combined_response["responses"].append(entry)
-
-    return combined_response
+    return {
+        "prompt": prompt,
+        "responses": [
+            {"source": label, "text": None, "error": str(response), "length": 0}
+            if isinstance(response, BaseException)
+            else {"source": label, "text": response, "error": None, "length": len(response)}
+            for label, response in labeled_responses
+        ]
+    }
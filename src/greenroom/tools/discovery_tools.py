@@ -1,18 +1,31 @@
 """Media discovery tools for the greenroom MCP server."""
 
+from string import ascii_lowercase
+
 from fastmcp import FastMCP
 
 from greenroom.models.responses import DiscoveryResultDict
 from greenroom.services.protocols import MediaService
-from greenroom.services.tmdb.service import TMDBService
 from greenroom.models.media import MediaList
 from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION
 
+# Media types that have discovery tools; built once rather than per validation call
+_DISCOVERY_MEDIA_TYPES = frozenset({MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION})
 
-def register_discovery_tools(mcp: FastMCP) -> None:
-    """Register media discovery tools with the MCP server."""
+# Accepted sort_by values, in the order listed in error messages, plus a set for lookups
+_DISCOVERY_SORT_OPTIONS = (
+    "popularity.desc", "popularity.asc",
+    "vote_average.desc", "vote_average.asc",
+    "date.desc", "date.asc"
+)
+_DISCOVERY_SORT_OPTION_SET = frozenset(_DISCOVERY_SORT_OPTIONS)
+
+# Every two-letter ASCII code, so ISO 639-1 validation is a single set lookup
+_LANGUAGE_CODES = frozenset(a + b for a in ascii_lowercase for b in ascii_lowercase)
 
-    service = TMDBService()
+
+def register_discovery_tools(mcp: FastMCP, service: MediaService) -> None:
+    """Register media discovery tools with the MCP server."""
 
     @mcp.tool()
     async def discover_films(
@@ -198,7 +211,7 @@ def _validate_discovery_params_internal(
         ValueError: If any parameter is invalid
     """
 
-    if media_type not in [MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION]:
+    if media_type not in _DISCOVERY_MEDIA_TYPES:
         raise ValueError(f"media_type must be one of: {MEDIA_TYPE_FILM}, {MEDIA_TYPE_TELEVISION}")
 
     if year is not None and year < 1900:
@@ -211,17 +224,11 @@ def _validate_discovery_params_internal(
         raise ValueError("max_results must be between 1 and 100")
 
     if language is not None:
-        if not isinstance(language, str) or len(language) != 2 or not language.isalpha():
+        if not isinstance(language, str) or language.lower() not in _LANGUAGE_CODES:
             raise ValueError("language must be a 2-character ISO 639-1 code (e.g., 'en', 'es', 'fr')")
 
-    if sort_by is not None:
-        valid_sort_options = [
-            "popularity.desc", "popularity.asc",
-            "vote_average.desc", "vote_average.asc",
-            "date.desc", "date.asc"
-        ]
-        if sort_by not in valid_sort_options:
-            raise ValueError(f"sort_by must be one of: {', '.join(valid_sort_options)}")
+    if sort_by is not None and sort_by not in _DISCOVERY_SORT_OPTION_SET:
+        raise ValueError(f"sort_by must be one of: {', '.join(_DISCOVERY_SORT_OPTIONS)}")
 
 
 def _format_media_list(media_list: MediaList, media_service: MediaService) -> DiscoveryResultDict:
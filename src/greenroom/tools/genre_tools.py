@@ -1,22 +1,33 @@
 """Categorization tools for the greenroom MCP server."""
 
+import asyncio
+
+import orjson
 from fastmcp import FastMCP, Context
 
-from greenroom.config import Mood, GENRE_MOOD_MAP
+from greenroom.config import (
+    Mood,
+    MOOD_VALUE_SET,
+    LLM_MOOD_VALUE_SET,
+    GENRE_MOOD_MAP,
+    GENRE_CATEGORIZATION_BATCH_SIZE,
+    GENRE_CATEGORIZATION_MAX_CONCURRENT,
+)
 from greenroom.models.responses import GenrePropertiesDict
 from greenroom.exceptions import SamplingError
 from greenroom.utils import create_empty_categorized_dict
+from greenroom.services.mood_cache import MoodCache
 from greenroom.services.protocols import MediaService
-from greenroom.services.tmdb.service import TMDBService
 
 
 __all__ = ["register_genre_tools", "fetch_genres"]
 
 
-def register_genre_tools(mcp: FastMCP) -> None:
-    """Register all genre-related tools with the MCP server and TMDB service."""
+def register_genre_tools(mcp: FastMCP, service: MediaService, mood_cache: MoodCache | None = None) -> None:
+    """Register all genre-related tools with the MCP server and media service.
 
-    service = TMDBService()
+    When a mood cache is given, LLM mood classifications are reused across calls and restarts.
+    """
 
     @mcp.tool()
     async def list_genres() -> dict[str, GenrePropertiesDict]:
@@ -83,7 +94,7 @@ def register_genre_tools(mcp: FastMCP) -> None:
         """
 
         # Delegate to helper function to enable unit testing without FastMCP server setup
-        return await categorize_all_genres(ctx, service)
+        return await categorize_all_genres(ctx, service, mood_cache)
 
 # =============================================================================
 # Helper Methods (extracted from tools to ease unit testing)
@@ -132,8 +143,15 @@ async def simplify_genres(ctx: Context, service: MediaService) -> str:
         return ", ".join(sorted(genres.keys()))
 
 
-async def categorize_all_genres(ctx: Context, service: MediaService) -> dict[str, list[str]]:
-    """Encapsulates the genre categorization logic."""
+async def categorize_all_genres(
+    ctx: Context,
+    service: MediaService,
+    mood_cache: MoodCache | None = None
+) -> dict[str, list[str]]:
+    """Encapsulates the genre categorization logic.
+
+    Unknown genres found in mood_cache skip the LLM; new LLM classifications are stored in it.
+    """
 
     # Fetch all genres
     genres = await fetch_genres(service)
@@ -141,43 +159,90 @@ async def categorize_all_genres(ctx: Context, service: MediaService) -> dict[str
     # Initialize category buckets using helper function
     categorized = create_empty_categorized_dict()
 
+    # Sort once; the same order drives the LLM prompt and the category lists
+    genre_names = sorted(genres.keys())
+
+    # Hardcoded mappings first; remaining genres are sent to the LLM in concurrent batches
+    unknown_genres = [name for name in genre_names if name not in GENRE_MOOD_MAP]
+    llm_moods: dict[str, str] = {}
+    if mood_cache is not None and unknown_genres:
+        # SQLite I/O is blocking, so it runs off the event loop
+        llm_moods = await asyncio.to_thread(mood_cache.get_many, unknown_genres)
+    uncached_genres = [name for name in unknown_genres if name not in llm_moods]
+    batches = [
+        uncached_genres[start:start + GENRE_CATEGORIZATION_BATCH_SIZE]
+        for start in range(0, len(uncached_genres), GENRE_CATEGORIZATION_BATCH_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(GENRE_CATEGORIZATION_MAX_CONCURRENT)
+
+    async def categorize_batch(batch: list[str]) -> dict[str, str] | None:
+        async with semaphore:
+            return await _categorize_unknown_genres(batch, ctx)
+
+    # Probe with the first batch so a client without sampling support fails once, not per batch
+    batch_results = [await categorize_batch(batches[0])] if batches else []
+    if batch_results and batch_results[0] is not None:
+        batch_results += await asyncio.gather(*(categorize_batch(batch) for batch in batches[1:]))
+
+    for batch_moods in batch_results:
+        if not batch_moods:
+            continue
+        if mood_cache is not None:
+            # Only cache real classifications; an "Other" answer is retried on the next call
+            cacheable = {name: mood for name, mood in batch_moods.items() if mood in LLM_MOOD_VALUE_SET}
+            await asyncio.to_thread(mood_cache.set_many, cacheable)
+        llm_moods.update(batch_moods)
+
     # Categorize each genre
-    for genre_name in sorted(genres.keys()):
-        mood = await _categorize_single_genre(genre_name, ctx)
+    for genre_name in genre_names:
+        mood = GENRE_MOOD_MAP.get(genre_name) or llm_moods.get(genre_name, Mood.OTHER.value)
         if mood in categorized:
             categorized[mood].append(genre_name)
 
     return categorized
 
-async def _categorize_single_genre(genre_name: str, ctx: Context) -> str:
+async def _categorize_unknown_genres(genre_names: list[str], ctx: Context) -> dict[str, str] | None:
     """
-    Categorize a single genre using hybrid approach:
-    First checks hardcoded mappings, then falls back to LLM sampling for unknown genres.
+    Categorize genres missing from the hardcoded mappings with one LLM sampling call.
+    The LLM is asked for a JSON object mapping each genre name to a mood; genres it
+    omits or assigns an invalid mood are left out, so callers default them to "Other".
+    Returns None when the sampling call itself fails, signalling that the LLM is unavailable.
     """
 
-    # Check hardcoded mapping first
-    if genre_name in GENRE_MOOD_MAP:
-        return GENRE_MOOD_MAP[genre_name]
-
-    # Fall back to LLM sampling for unknown genres
     try:
         response = await ctx.sample(
-            messages=f"Categorize the genre '{genre_name}' into exactly one of these moods: Dark, Light, Serious, or Fun. Respond with only the single mood word, nothing else.",
-            system_prompt="You are a genre categorization system. Classify genres by mood/tone:\n- Dark: suspenseful, scary, intense\n- Light: uplifting, cheerful, entertaining\n- Serious: educational, thought-provoking, heavy topics\n- Fun: exciting, adventurous, escapist\nRespond with only one word.",
+            messages=f"Categorize each of these genres into exactly one of these moods: Dark, Light, Serious, or Fun. Respond with only a JSON object mapping each genre name to its mood word, nothing else.\nGenres: {orjson.dumps(genre_names).decode()}",
+            system_prompt="You are a genre categorization system. Classify genres by mood/tone:\n- Dark: suspenseful, scary, intense\n- Light: uplifting, cheerful, entertaining\n- Serious: educational, thought-provoking, heavy topics\n- Fun: exciting, adventurous, escapist\nRespond with only a JSON object.",
             temperature=0.0,
-            max_tokens=10
+            max_tokens=20 * len(genre_names) + 20
         )
+    except Exception as e:
+        # Catch broad exception because we don't know the specific exception type
+        # raised when sampling is not supported by the client
+        await ctx.warning(f"LLM categorization unavailable ({type(e).__name__}: {e}), using Other for unknown genres")
+        return None
 
+    try:
         # Normalize and validate the response
-        if not hasattr(response, "text"):
+        text: str | None = getattr(response, "text", None)
+        if text is None:
             raise SamplingError(f"Sampling returned unexpected content type: {type(response)}")
-        mood = response.text.strip()
-        if mood in [m.value for m in Mood]:
-            return mood
+
+        # Tolerate prose or code fences around the JSON object
+        moods = orjson.loads(text[text.find("{"):text.rfind("}") + 1])
+        if not isinstance(moods, dict):
+            raise SamplingError(f"Sampling returned unexpected JSON type: {type(moods)}")
+
+        requested = set(genre_names)
+        return {
+            genre_name: mood.strip()
+            for genre_name, mood in moods.items()
+            if genre_name in requested and isinstance(mood, str) and mood.strip() in MOOD_VALUE_SET
+        }
 
     except Exception as e:
-        # Log warning if sampling fails
-        await ctx.warning(f"LLM categorization failed for '{genre_name}' ({type(e).__name__}: {e})")
+        # Log warning if the response cannot be parsed
+        await ctx.warning(f"LLM categorization failed for {len(genre_names)} genre(s) ({type(e).__name__}: {e})")
 
-    # Default fallback: categorize as "Other" if we can't determine
-    return Mood.OTHER.value
+    # Default fallback: callers categorize every genre as "Other"
+    return {}
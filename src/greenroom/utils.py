@@ -1,13 +1,13 @@
 """Utility helper functions for the greenroom MCP server."""
 
-from greenroom.config import Mood
+from greenroom.config import MOOD_VALUES
 
 
 def create_empty_categorized_dict() -> dict[str, list[str]]:
     """
     Create empty categorized dictionary structure for genre categorization.
 
-    Dynamically constructs the structure by looping over all Mood enum values,
+    Built from MOOD_VALUES, which is derived from the Mood enum at import,
     ensuring the dict stays in sync with the enum definition.
 
     Returns:
@@ -19,4 +19,4 @@ def create_empty_categorized_dict() -> dict[str, list[str]]:
         >>> result
         {'Dark': [], 'Light': [], 'Serious': [], 'Fun': [], 'Other': []}
     """
-    return {mood.value: [] for mood in Mood}
+    return {mood: [] for mood in MOOD_VALUES}
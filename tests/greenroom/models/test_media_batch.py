@@ -0,0 +1,66 @@
+"""Tests for MediaBatch."""
+
+from datetime import date
+
+from greenroom.models.media import Media, MediaList
+from greenroom.models.media_batch import MediaBatch
+from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION, MediaTypeCode
+
+
+def _sample_media_list() -> MediaList:
+    return MediaList(
+        results=[
+            Media(
+                id="1",
+                media_type=MEDIA_TYPE_FILM,
+                title="Film 1",
+                date=date(2024, 1, 15),
+                rating=7.5,
+                description="Description 1",
+                genre_ids=[28, 12],
+            ),
+            Media(
+                id="2",
+                media_type=MEDIA_TYPE_TELEVISION,
+                title="Show 2",
+            ),
+            Media(
+                id="3",
+                media_type=MEDIA_TYPE_FILM,
+                title="Film 3",
+                date=date(1999, 3, 31),
+                rating=8.7,
+            ),
+        ],
+        total_results=3,
+        page=1,
+        total_pages=1,
+    )
+
+
+def test_from_media_list_builds_columns():
+    """Test that each Media field is stored in its own column with missing values encoded."""
+    batch = MediaBatch.from_media_list(_sample_media_list())
+
+    assert len(batch) == 3
+    assert batch.ids == ["1", "2", "3"]
+    assert list(batch.media_types) == [MediaTypeCode.FILM, MediaTypeCode.TELEVISION, MediaTypeCode.FILM]
+    assert batch.ratings[0] == 7.5
+    assert batch.ratings[1] != batch.ratings[1]  # NaN for missing rating
+    assert batch.dates[1] == 0
+    assert batch.genre_ids == [[28, 12], None, None]
+
+
+def test_round_trip_preserves_media_list():
+    """Test that to_media_list reverses from_media_list."""
+    media_list = _sample_media_list()
+
+    assert MediaBatch.from_media_list(media_list).to_media_list() == media_list
+
+
+def test_order_by_rating_puts_unrated_last():
+    """Test that rating order is descending by default and unrated rows sort last."""
+    batch = MediaBatch.from_media_list(_sample_media_list())
+
+    assert batch.order_by_rating() == [2, 0, 1]
+    assert batch.order_by_rating(descending=False) == [0, 2, 1]
@@ -1,24 +1,26 @@
-"""Tests for OllamaClient."""
+"""Tests for OllamaClient. HTTP traffic is mocked at the transport layer by pytest-httpx."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 
 import httpx
+import orjson
 import pytest
+from pytest_httpx import HTTPXMock
 
 from greenroom.exceptions import APIConnectionError, APIResponseError, APITypeError
+from greenroom.services.llm.config import OLLAMA_CONNECT_TIMEOUT
 from greenroom.services.llm.ollama_client import OllamaClient
 
+GENERATE_URL = "http://localhost:11434/api/generate"
 
-@pytest.mark.asyncio
-@patch("greenroom.services.llm.ollama_client.httpx.AsyncClient")
-async def test_generate_success(mock_async_client_class):
+
+async def test_generate_success(httpx_mock: HTTPXMock):
     """Test OllamaClient.generate() successfully calls Ollama API."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"response": "Ollama's response", "done": True}
-    mock_response.raise_for_status = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
-    mock_async_client_class.return_value.__aenter__.return_value = mock_client
+    httpx_mock.add_response(
+        method="POST",
+        url=GENERATE_URL,
+        json={"response": "Ollama's response", "done": True}
+    )
 
     client = OllamaClient()
     result = await client.generate("Test prompt", "llama3.2:latest", 0.5, 200)
@@ -26,78 +28,102 @@ async def test_generate_success(mock_async_client_class):
     assert result == {"response": "Ollama's response", "done": True}
 
     # Verify API call
-    mock_client.post.assert_called_once()
-    call_args = mock_client.post.call_args
-    assert "http://localhost:11434/api/generate" in call_args[0][0]
-    assert call_args[1]["json"]["model"] == "llama3.2:latest"
-    assert call_args[1]["json"]["prompt"] == "Test prompt"
-    assert call_args[1]["json"]["stream"] is False
-    assert call_args[1]["json"]["options"]["temperature"] == 0.5
-    assert call_args[1]["json"]["options"]["num_predict"] == 200
-
-
-@pytest.mark.asyncio
-@patch("greenroom.services.llm.ollama_client.httpx.AsyncClient")
-async def test_generate_handles_http_errors(mock_async_client_class):
+    request = httpx_mock.get_request()
+    assert request is not None
+    body = orjson.loads(request.content)
+    assert body["model"] == "llama3.2:latest"
+    assert body["prompt"] == "Test prompt"
+    assert body["stream"] is False
+    assert body["options"]["temperature"] == 0.5
+    assert body["options"]["num_predict"] == 200
+
+
+async def test_generate_handles_http_errors(httpx_mock: HTTPXMock):
     """Test OllamaClient.generate() handles HTTP status errors."""
-    mock_client = MagicMock()
-    mock_error_response = MagicMock()
-    mock_error_response.status_code = 404
-    mock_error_response.text = "Model not found"
-    mock_client.post = AsyncMock(
-        side_effect=httpx.HTTPStatusError("404", request=MagicMock(), response=mock_error_response)
-    )
-    mock_async_client_class.return_value.__aenter__.return_value = mock_client
+    httpx_mock.add_response(method="POST", url=GENERATE_URL, status_code=404, text="Model not found")
 
     client = OllamaClient()
     with pytest.raises(APIResponseError, match="Ollama API error: 404 - Model not found"):
         await client.generate("Test", "unknown-model", 0.7, 100)
 
 
-@pytest.mark.asyncio
-@patch("greenroom.services.llm.ollama_client.httpx.AsyncClient")
-async def test_generate_handles_connection_errors(mock_async_client_class):
+async def test_generate_handles_connection_errors(httpx_mock: HTTPXMock):
     """Test OllamaClient.generate() handles connection errors."""
-    mock_client = MagicMock()
-    mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-    mock_async_client_class.return_value.__aenter__.return_value = mock_client
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
 
     client = OllamaClient()
     with pytest.raises(APIConnectionError, match="Failed to connect to Ollama API"):
         await client.generate("Test", "llama3.2:latest", 0.7, 100)
 
 
-@pytest.mark.asyncio
-@patch("greenroom.services.llm.ollama_client.httpx.AsyncClient")
-@patch.dict("os.environ", {"OLLAMA_BASE_URL": "http://custom:8080"})
-async def test_generate_uses_env_var(mock_async_client_class):
+async def test_generate_uses_env_var(monkeypatch, httpx_mock: HTTPXMock):
     """Test OllamaClient.generate() uses OLLAMA_BASE_URL from environment."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"response": "Response"}
-    mock_response.raise_for_status = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
-    mock_async_client_class.return_value.__aenter__.return_value = mock_client
+    monkeypatch.setenv("OLLAMA_BASE_URL", "http://custom:8080")
+
+    # Only the custom URL is mocked, so a request to the default URL would fail
+    httpx_mock.add_response(method="POST", url="http://custom:8080/api/generate", json={"response": "Response"})
 
     client = OllamaClient()
     await client.generate("Test", "llama3.2:latest", 0.7, 100)
 
-    # Verify custom URL was used
-    call_args = mock_client.post.call_args
-    assert "http://custom:8080/api/generate" in call_args[0][0]
+    assert client.base_url == "http://custom:8080"
 
 
-@pytest.mark.asyncio
-@patch("greenroom.services.llm.ollama_client.httpx.AsyncClient")
-async def test_generate_raises_api_type_error_for_non_dict_response(mock_async_client_class):
-    """Test OllamaClient.generate() raises APITypeError when response.json() is not a dict."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.json.return_value = ["not", "a", "dict"]
-    mock_response.raise_for_status = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
-    mock_async_client_class.return_value.__aenter__.return_value = mock_client
+async def test_generate_raises_api_type_error_for_non_dict_response(httpx_mock: HTTPXMock):
+    """Test OllamaClient.generate() raises APITypeError when the JSON body is not a dict."""
+    httpx_mock.add_response(method="POST", url=GENERATE_URL, json=["not", "a", "dict"])
 
     client = OllamaClient()
     with pytest.raises(APITypeError, match="Ollama API returned unexpected type"):
         await client.generate("Test", "llama3.2:latest", 0.7, 100)
+
+
+async def test_generate_raises_api_response_error_for_invalid_json(httpx_mock: HTTPXMock):
+    """Test OllamaClient.generate() raises APIResponseError when the body is not valid JSON."""
+    httpx_mock.add_response(method="POST", url=GENERATE_URL, content=b"not json")
+
+    client = OllamaClient()
+    with pytest.raises(APIResponseError, match="Ollama API returned invalid JSON"):
+        await client.generate("Test", "llama3.2:latest", 0.7, 100)
+
+
+async def test_client_reuses_pooled_connection(httpx_mock: HTTPXMock):
+    """Test OllamaClient reuses one httpx client across calls and closes it on context exit."""
+    httpx_mock.add_response(method="POST", url=GENERATE_URL, json={"response": "Response"}, is_reusable=True)
+
+    async with OllamaClient() as client:
+        pooled_client = client._client
+        await client.generate("First", "llama3.2:latest", 0.7, 100)
+        await client.generate("Second", "llama3.2:latest", 0.7, 100)
+        assert client._client is pooled_client
+
+    assert pooled_client.timeout.connect == OLLAMA_CONNECT_TIMEOUT
+    assert len(httpx_mock.get_requests()) == 2
+    assert pooled_client.is_closed
+
+
+async def test_batch_generate_bounds_concurrency_and_preserves_order():
+    """Test batch_generate keeps at most max_concurrent requests in flight and returns results in prompt order."""
+    client = OllamaClient()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_generate(prompt, model, temperature, max_tokens):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if prompt == "prompt 3":
+            raise APIResponseError("Ollama API error: 500 - boom")
+        return {"response": prompt}
+
+    client.generate = fake_generate
+    prompts = [f"prompt {i}" for i in range(20)]
+
+    results = await client.batch_generate(prompts, "llama3.2:latest", 0.7, 100, max_concurrent=5)
+    await client.aclose()
+
+    assert max_in_flight == 5
+    assert isinstance(results[3], APIResponseError)
+    assert [r["response"] for i, r in enumerate(results) if i != 3] == [p for i, p in enumerate(prompts) if i != 3]
@@ -1,6 +1,8 @@
 """Tests for LLMService."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,37 +10,41 @@ from greenroom.exceptions import APIConnectionError, APIResponseError, SamplingE
 from greenroom.services.llm.service import LLMService
 
 
-@pytest.mark.asyncio
+class StubContext:
+    """Minimal stand-in for a FastMCP Context: sample() returns a canned response or raises."""
+
+    def __init__(self, response: object = None, error: Exception | None = None):
+        self.response = response
+        self.error = error
+        self.calls: list[dict] = []
+
+    async def sample(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
 async def test_generate_response_from_claude_success():
     """Test LLMService.generate_response_from_claude() successfully calls ctx.sample."""
-    mock_ctx = MagicMock()
-    mock_response = MagicMock()
-    mock_response.text = "Claude's response"
-    mock_ctx.sample = AsyncMock(return_value=mock_response)
+    ctx = StubContext(SimpleNamespace(text="Claude's response"))
 
     service = LLMService()
-    result = await service.resample_current_llm(mock_ctx, "Test prompt", 0.5, 200)
+    result = await service.resample_current_llm(ctx, "Test prompt", 0.5, 200)
 
     assert result == "Claude's response"
-    mock_ctx.sample.assert_called_once_with(
-        messages="Test prompt",
-        temperature=0.5,
-        max_tokens=200
-    )
+    assert ctx.calls == [{"messages": "Test prompt", "temperature": 0.5, "max_tokens": 200}]
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_claude_handles_errors():
     """Test LLMService.generate_response_from_claude() wraps errors in SamplingError."""
-    mock_ctx = MagicMock()
-    mock_ctx.sample = AsyncMock(side_effect=Exception("Sample failed"))
+    ctx = StubContext(error=Exception("Sample failed"))
 
     service = LLMService()
     with pytest.raises(SamplingError, match="Claude API error: Sample failed"):
-        await service.resample_current_llm(mock_ctx, "Test", 0.7, 100)
+        await service.resample_current_llm(ctx, "Test", 0.7, 100)
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_ollama_success():
     """Test LLMService.generate_response_from_ollama() delegates to client and extracts response."""
     service = LLMService()
@@ -54,7 +60,6 @@ async def test_generate_response_from_ollama_success():
     )
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_ollama_empty_response():
     """Test LLMService.generate_response_from_ollama() returns empty string when response key missing."""
     service = LLMService()
@@ -65,7 +70,6 @@ async def test_generate_response_from_ollama_empty_response():
     assert result == ""
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_ollama_propagates_runtime_error():
     """Test LLMService.generate_response_from_ollama() propagates APIResponseError from client."""
     service = LLMService()
@@ -77,7 +81,6 @@ async def test_generate_response_from_ollama_propagates_runtime_error():
         await service.generate_response_from_alternative_llm("Test", 0.7, 100)
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_ollama_propagates_connection_error():
     """Test LLMService.generate_response_from_ollama() propagates APIConnectionError from client."""
     service = LLMService()
@@ -89,13 +92,40 @@ async def test_generate_response_from_ollama_propagates_connection_error():
         await service.generate_response_from_alternative_llm("Test", 0.7, 100)
 
 
-@pytest.mark.asyncio
 async def test_generate_response_from_claude_raises_sampling_error_for_missing_text():
     """Test LLMService.generate_response_from_claude() raises SamplingError when response lacks .text."""
-    mock_ctx = MagicMock()
-    mock_response = MagicMock(spec=[])  # spec=[] means no attributes
-    mock_ctx.sample = AsyncMock(return_value=mock_response)
+    ctx = StubContext(SimpleNamespace())  # Response object without a text attribute
 
     service = LLMService()
     with pytest.raises(SamplingError, match="Claude API returned unexpected content type"):
-        await service.resample_current_llm(mock_ctx, "Test", 0.7, 100)
+        await service.resample_current_llm(ctx, "Test", 0.7, 100)
+
+
+async def test_batch_generate_from_ollama_bounds_concurrency_and_keeps_errors():
+    """Test LLMService.batch_generate_from_alternative_llm() caps in-flight calls, extracts responses and keeps errors in order."""
+    error = APIConnectionError("Failed to connect")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def generate(prompt, model, temperature, max_tokens):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if prompt == "Two":
+            raise error
+        if prompt == "Three":
+            return {"done": True}
+        return {"response": f"Answer to {prompt}"}
+
+    service = LLMService()
+    service.client.generate = AsyncMock(side_effect=generate)
+
+    results = await service.batch_generate_from_alternative_llm(
+        ["One", "Two", "Three", "Four", "Five"], 0.5, 200, max_concurrent=2
+    )
+
+    assert results == ["Answer to One", error, "", "Answer to Four", "Answer to Five"]
+    assert max_in_flight == 2
+    service.client.generate.assert_any_call("One", "llama3.2:latest", 0.5, 200)
@@ -0,0 +1,110 @@
+"""Tests for the persistent MoodCache."""
+
+import sqlite3
+
+import pytest
+
+from greenroom.services.mood_cache import MoodCache, create_mood_cache
+
+
+def test_get_many_returns_stored_moods_across_instances(tmp_path):
+    """Test that moods persist on disk and are found by a new cache instance."""
+    path = tmp_path / "moods.sqlite"
+    cache = MoodCache(path)
+    assert cache.open()
+    cache.set_many({"Western": "Fun", "Noir": "Dark"})
+    cache.close()
+
+    reopened = MoodCache(path)
+    reopened.open()
+    assert reopened.get_many(["Noir", "Western", "Experimental"]) == {"Noir": "Dark", "Western": "Fun"}
+    reopened.close()
+
+
+def test_get_many_normalizes_genre_names(tmp_path):
+    """Test that lookups ignore case and surrounding whitespace."""
+    cache = MoodCache(tmp_path / "moods.sqlite")
+    cache.open()
+    cache.set_many({"Film Noir": "Dark"})
+
+    assert cache.get_many([" film noir", "FILM NOIR"]) == {" film noir": "Dark", "FILM NOIR": "Dark"}
+    cache.close()
+
+
+def test_get_many_ignores_entries_from_another_version_or_past_ttl(tmp_path):
+    """Test that entries stored under an older prompt version or before the ttl are misses."""
+    path = tmp_path / "moods.sqlite"
+    old = MoodCache(path, version=1)
+    old.open()
+    old.set_many({"Western": "Fun"})
+    old.close()
+
+    current = MoodCache(path, version=2)
+    current.open()
+    assert current.get_many(["Western"]) == {}
+
+    current.set_many({"Western": "Light"})
+    assert current.get_many(["Western"]) == {"Western": "Light"}
+    current.close()
+
+    expired = MoodCache(path, version=2, ttl=0)
+    expired.open()
+    assert expired.get_many(["Western"]) == {}
+    expired.close()
+
+
+def test_open_twice_closes_previous_connection(tmp_path):
+    """Test that reopening the cache closes the connection it replaces."""
+    cache = MoodCache(tmp_path / "moods.sqlite")
+    cache.open()
+    first_conn = cache._conn
+    assert first_conn is not None
+
+    cache.open()
+
+    assert cache._conn is not first_conn
+    with pytest.raises(sqlite3.ProgrammingError):
+        first_conn.execute("SELECT 1")
+    cache.close()
+
+
+def test_unopened_or_closed_cache_misses_without_raising(tmp_path):
+    """Test that a cache that is not open yields no hits and drops writes instead of raising."""
+    path = tmp_path / "moods.sqlite"
+    cache = MoodCache(path)
+
+    # Nothing touches the filesystem until open()
+    assert cache.get_many(["Western"]) == {}
+    cache.set_many({"Western": "Fun"})
+    assert not path.exists()
+
+    cache.open()
+    cache.set_many({"Western": "Fun"})
+    cache.close()
+
+    assert cache.get_many(["Western"]) == {}
+    cache.set_many({"Noir": "Dark"})  # Does not raise
+
+
+def test_open_returns_false_when_database_cannot_be_created(tmp_path):
+    """Test that open() reports failure instead of raising when the path is unusable."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+
+    cache = MoodCache(blocker / "moods.sqlite")
+    assert cache.open() is False
+    assert cache.get_many(["Western"]) == {}
+
+
+def test_create_mood_cache_respects_environment(monkeypatch, tmp_path):
+    """Test that the cache location can be overridden and the cache disabled."""
+    path = tmp_path / "nested" / "moods.sqlite"
+    monkeypatch.setenv("GREENROOM_MOOD_CACHE_PATH", str(path))
+
+    cache = create_mood_cache()
+    assert cache is not None
+    assert cache.path == path
+    assert not path.exists()
+
+    monkeypatch.setenv("GREENROOM_NO_MOOD_CACHE", "1")
+    assert create_mood_cache() is None
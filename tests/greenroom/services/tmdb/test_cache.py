@@ -0,0 +1,70 @@
+"""Tests for the TMDB response TTLCache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from greenroom.services.tmdb.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's monotonic clock with a controllable one."""
+    now = [1000.0]
+    monkeypatch.setattr("greenroom.services.tmdb.cache.time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    """Test that entries are served until their TTL elapses, then dropped."""
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=60)
+    cache.set("key", "value")
+
+    clock[0] += 59
+    assert cache.get("key") == "value"
+
+    clock[0] += 2
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_set_accepts_per_entry_ttl(clock):
+    """Test that a per-entry TTL overrides the cache default."""
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=60)
+    cache.set("long", "value", ttl=600)
+
+    clock[0] += 120
+    assert cache.get("long") == "value"
+
+
+def test_evicts_least_recently_used_entry_when_full(clock):
+    """Test that the least recently used entry is evicted beyond maxsize."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")          # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_clear_removes_all_entries(clock):
+    """Test that clear empties the cache."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_len_excludes_expired_entries(clock):
+    """Test that len() counts only live entries, even before expired ones are read."""
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=60)
+    cache.set("short", "value", ttl=10)
+    cache.set("long", "value")
+
+    clock[0] += 11
+    assert len(cache) == 1
+    assert cache.get("long") == "value"
@@ -1,33 +1,68 @@
 """Tests for TMDBService."""
 
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from greenroom.exceptions import APIConnectionError, APIResponseError
 from greenroom.services.tmdb.service import TMDBService
-from greenroom.services.tmdb.config import TMDB_FILM_CONFIG
+from greenroom.services.tmdb.config import TMDB_ERROR_BODY_LIMIT, TMDB_FILM_CONFIG, TMDB_GENRES_CACHE_TTL
 from greenroom.services.protocols import MediaService
 from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION
 
 
+@pytest.fixture(autouse=True)
+def tmdb_api_key(monkeypatch):
+    """Configure a fake TMDB API key for every test; tests needing no key delete it.
+
+    Services are still built per test: each holds its own response cache,
+    which must not leak between tests.
+    """
+    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
+
+
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+
+
+def discover_url(endpoint: str = "movie", **params) -> str:
+    """Build the expected discover URL: the default query parameters plus any overrides."""
+    query = {
+        "api_key": "test_api_key",
+        "sort_by": "popularity.desc",
+        "page": 1,
+        "include_adult": "false",
+        "include_video": "false",
+        **params,
+    }
+    return f"{TMDB_BASE_URL}/discover/{endpoint}?{urlencode(query)}"
+
+
+# Expected request URLs, built once
+DEFAULT_FILM_URL = discover_url()
+FILM_GENRES_URL = f"{TMDB_BASE_URL}/genre/movie/list?api_key=test_api_key"
+TV_GENRES_URL = f"{TMDB_BASE_URL}/genre/tv/list?api_key=test_api_key"
+
+# Payloads shared by several tests; built once and never mutated
+EMPTY_DISCOVER_RESPONSE = {"page": 1, "total_results": 0, "total_pages": 0, "results": []}
+EMPTY_GENRES_RESPONSE = {"genres": []}
+
+
 # =============================================================================
 # Protocol conformance tests
 # =============================================================================
 
 
-def test_tmdb_service_satisfies_media_service_protocol(monkeypatch):
+def test_tmdb_service_satisfies_media_service_protocol():
     """Test that TMDBService structurally satisfies the MediaService protocol."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     service = TMDBService()
     assert isinstance(service, MediaService)
 
 
-def test_get_provider_name_returns_correct_string(monkeypatch):
+def test_get_provider_name_returns_correct_string():
     """Test get_provider_name returns 'TMDB'."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     service = TMDBService()
 
     assert service.get_provider_name() == "TMDB"
@@ -38,11 +73,8 @@ def test_get_provider_name_returns_correct_string(monkeypatch):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_get_media_returns_media_list_for_films(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_returns_media_list_for_films(httpx_mock: HTTPXMock):
     """Test get_media returns properly formatted MediaList for films."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     mock_response = {
         "page": 1,
         "total_results": 100,
@@ -70,7 +102,7 @@ async def test_get_media_returns_media_list_for_films(monkeypatch, httpx_mock: H
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres=18&primary_release_year=1999",
+        url=discover_url(with_genres=18, primary_release_year=1999),
         json=mock_response
     )
 
@@ -88,11 +120,8 @@ async def test_get_media_returns_media_list_for_films(monkeypatch, httpx_mock: H
     assert result.results[1].title == "Pulp Fiction"
 
 
-@pytest.mark.asyncio
-async def test_get_media_returns_media_list_for_television(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_returns_media_list_for_television(httpx_mock: HTTPXMock):
     """Test get_media returns properly formatted MediaList for television shows."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     mock_response = {
         "page": 1,
         "total_results": 50,
@@ -118,7 +147,7 @@ async def test_get_media_returns_media_list_for_television(monkeypatch, httpx_mo
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/tv?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres=18&first_air_date_year=2011",
+        url=discover_url("tv", with_genres=18, first_air_date_year=2011),
         json=mock_response
     )
 
@@ -137,11 +166,8 @@ async def test_get_media_returns_media_list_for_television(monkeypatch, httpx_mo
     assert result.results[1].title == "Breaking Bad"
 
 
-@pytest.mark.asyncio
-async def test_get_media_handles_incomplete_data(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_handles_incomplete_data(httpx_mock: HTTPXMock):
     """Test that media with missing optional fields are handled gracefully."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     mock_response = {
         "page": 1,
         "total_results": 5,
@@ -157,7 +183,7 @@ async def test_get_media_handles_incomplete_data(monkeypatch, httpx_mock: HTTPXM
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         json=mock_response
     )
 
@@ -193,37 +219,50 @@ async def test_get_media_handles_incomplete_data(monkeypatch, httpx_mock: HTTPXM
     assert result.results[4].date is None
 
 
-@pytest.mark.asyncio
-async def test_get_media_handles_empty_results(monkeypatch, httpx_mock: HTTPXMock):
-    """Test get_media handles empty results gracefully."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
+async def test_get_media_skips_items_with_invalid_id_or_field_types(httpx_mock: HTTPXMock):
+    """Test that items without an integer id or with wrong-typed fields are skipped instead of raising."""
     mock_response = {
         "page": 1,
-        "total_results": 0,
-        "total_pages": 0,
-        "results": []
+        "total_results": 4,
+        "total_pages": 1,
+        "results": [
+            {"id": "1", "title": "Text Id"},
+            {"id": 2, "title": "Numeric Date", "release_date": 20240115},
+            {"id": 3, "title": "Text Rating", "vote_average": "high"},
+            {"id": 4, "title": "Valid Film", "release_date": "2024-01-15"},
+        ]
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         json=mock_response
     )
 
     service = TMDBService()
     result = await service.get_media(media_type=MEDIA_TYPE_FILM)
 
+    assert [media.title for media in result.results] == ["Valid Film"]
+    assert result.results[0].date.isoformat() == "2024-01-15"
+
+
+async def test_get_media_handles_empty_results(httpx_mock: HTTPXMock):
+    """Test get_media handles empty results gracefully."""
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        json=EMPTY_DISCOVER_RESPONSE
+    )
+
+    service = TMDBService()
+    result = await service.get_media(media_type=MEDIA_TYPE_FILM)
+
     assert result.results == []
     assert result.total_results == 0
     assert result.page == 1
     assert result.total_pages == 0
 
 
-@pytest.mark.asyncio
-async def test_get_media_respects_max_results(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_respects_max_results(httpx_mock: HTTPXMock):
     """Test that max_results parameter limits returned media."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     # Mock response with 20 films
     mock_results = [{"id": i, "title": f"Film {i}"} for i in range(20)]
     mock_response = {
@@ -234,7 +273,7 @@ async def test_get_media_respects_max_results(monkeypatch, httpx_mock: HTTPXMock
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         json=mock_response
     )
 
@@ -246,23 +285,37 @@ async def test_get_media_respects_max_results(monkeypatch, httpx_mock: HTTPXMock
     assert result.results[4].id == "4"
 
 
-@pytest.mark.asyncio
-async def test_get_media_uses_default_parameters(monkeypatch, httpx_mock: HTTPXMock):
-    """Test that get_media applies correct default parameters."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
+async def test_get_media_max_results_counts_only_valid_items(httpx_mock: HTTPXMock):
+    """Test that items skipped for missing IDs do not count toward max_results."""
     mock_response = {
         "page": 1,
-        "total_results": 0,
-        "total_pages": 0,
-        "results": []
+        "total_results": 3,
+        "total_pages": 1,
+        "results": [
+            {"title": "No ID"},
+            {"id": 1, "title": "First Valid"},
+            {"id": 2, "title": "Second Valid"},
+        ]
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         json=mock_response
     )
 
+    service = TMDBService()
+    result = await service.get_media(media_type=MEDIA_TYPE_FILM, max_results=1)
+
+    assert [media.title for media in result.results] == ["First Valid"]
+
+
+async def test_get_media_uses_default_parameters(httpx_mock: HTTPXMock):
+    """Test that get_media applies correct default parameters."""
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        json=EMPTY_DISCOVER_RESPONSE
+    )
+
     service = TMDBService()
     await service.get_media(media_type=MEDIA_TYPE_FILM)
 
@@ -274,11 +327,8 @@ async def test_get_media_uses_default_parameters(monkeypatch, httpx_mock: HTTPXM
     assert "include_adult=false" in str(request.url)
 
 
-@pytest.mark.asyncio
-async def test_get_media_filters_by_language(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_filters_by_language(httpx_mock: HTTPXMock):
     """Test language parameter filters media correctly."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     mock_response = {
         "page": 1,
         "total_results": 1,
@@ -289,7 +339,7 @@ async def test_get_media_filters_by_language(monkeypatch, httpx_mock: HTTPXMock)
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_original_language=es",
+        url=discover_url(with_original_language="es"),
         json=mock_response
     )
 
@@ -315,11 +365,8 @@ def test_get_media_raises_value_error_when_api_key_missing(monkeypatch):
     assert ".env file" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_media_raises_value_error_for_unsupported_media_type(monkeypatch):
+async def test_get_media_raises_value_error_for_unsupported_media_type():
     """Test that ValueError is raised for unsupported media types."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     service = TMDBService()
 
     with pytest.raises(ValueError) as exc_info:
@@ -329,13 +376,10 @@ async def test_get_media_raises_value_error_for_unsupported_media_type(monkeypat
     assert "unsupported_type" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_media_raises_api_response_error_on_http_error(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_raises_api_response_error_on_http_error(httpx_mock: HTTPXMock):
     """Test that APIResponseError is raised when TMDB API returns HTTP error."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         status_code=401,
         text="Invalid API key"
     )
@@ -349,13 +393,28 @@ async def test_get_media_raises_api_response_error_on_http_error(monkeypatch, ht
     assert "401" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_media_raises_api_response_error_on_invalid_json(monkeypatch, httpx_mock: HTTPXMock):
-    """Test that APIResponseError is raised when TMDB API returns invalid JSON."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
+async def test_get_media_error_message_truncates_large_body(httpx_mock: HTTPXMock):
+    """Test that only a bounded prefix of a large error body is included in the error message."""
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        status_code=503,
+        text="<html>" + "x" * 10_000
+    )
+
+    service = TMDBService()
+
+    with pytest.raises(APIResponseError) as exc_info:
+        await service.get_media(media_type=MEDIA_TYPE_FILM)
+
+    message = str(exc_info.value)
+    assert message.startswith("TMDB API error: 503 - <html>")
+    assert len(message) < len("TMDB API error: 503 - ") + TMDB_ERROR_BODY_LIMIT + 1
+
 
+async def test_get_media_raises_api_response_error_on_invalid_json(httpx_mock: HTTPXMock):
+    """Test that APIResponseError is raised when TMDB API returns invalid JSON."""
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false",
+        url=DEFAULT_FILM_URL,
         content=b"Not valid JSON!"
     )
 
@@ -367,14 +426,11 @@ async def test_get_media_raises_api_response_error_on_invalid_json(monkeypatch,
     assert "invalid JSON" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_media_raises_api_connection_error_on_request_failure(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_media_raises_api_connection_error_on_request_failure(httpx_mock: HTTPXMock):
     """Test that APIConnectionError is raised when unable to connect to TMDB API."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     httpx_mock.add_exception(
         httpx.RequestError("Connection refused"),
-        url="https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false"
+        url=DEFAULT_FILM_URL
     )
 
     service = TMDBService()
@@ -385,16 +441,55 @@ async def test_get_media_raises_api_connection_error_on_request_failure(monkeypa
     assert "Failed to connect to TMDB API" in str(exc_info.value)
 
 
+async def test_get_media_does_not_cache_discover_queries(httpx_mock: HTTPXMock):
+    """Test that repeated discover queries always fetch fresh results from TMDB."""
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        json={"page": 1, "total_results": 1, "total_pages": 1, "results": [{"id": 1, "title": "First Film"}]}
+    )
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        json={"page": 1, "total_results": 1, "total_pages": 1, "results": [{"id": 2, "title": "Newer Film"}]}
+    )
+
+    service = TMDBService()
+    first = await service.get_media(media_type=MEDIA_TYPE_FILM)
+    second = await service.get_media(media_type=MEDIA_TYPE_FILM)
+
+    assert first.results[0].title == "First Film"
+    assert second.results[0].title == "Newer Film"
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_service_reuses_one_http_client_and_closes_it(httpx_mock: HTTPXMock):
+    """Test that requests share the pooled client and leaving the context closes it."""
+    httpx_mock.add_response(
+        url=DEFAULT_FILM_URL,
+        json=EMPTY_DISCOVER_RESPONSE
+    )
+    httpx_mock.add_response(
+        url=discover_url("tv"),
+        json=EMPTY_DISCOVER_RESPONSE
+    )
+
+    async with TMDBService() as service:
+        http_client = service.client._client
+        await service.get_media(media_type=MEDIA_TYPE_FILM)
+        await service.get_media(media_type=MEDIA_TYPE_TELEVISION)
+
+        assert service.client._client is http_client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+
+
 # =============================================================================
 # get_genres() tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_get_genres_combines_film_and_tv_genres(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_genres_combines_film_and_tv_genres(httpx_mock: HTTPXMock):
     """Test get_genres returns combined film and TV genres with correct flags."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     film_genres = {
         "genres": [
             {"id": 28, "name": "Action"},
@@ -410,11 +505,11 @@ async def test_get_genres_combines_film_and_tv_genres(monkeypatch, httpx_mock: H
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         json=film_genres
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
+        url=TV_GENRES_URL,
         json=tv_genres
     )
 
@@ -443,11 +538,8 @@ async def test_get_genres_combines_film_and_tv_genres(monkeypatch, httpx_mock: H
     assert genres_by_name["Mystery"].has_tv_shows is True
 
 
-@pytest.mark.asyncio
-async def test_get_genres_drops_incomplete_genre_data(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_genres_drops_incomplete_genre_data(httpx_mock: HTTPXMock):
     """Test that genres with missing id or name fields are silently dropped."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     film_genres = {
         "genres": [
             {"id": 28, "name": "Action"},  # Valid
@@ -464,11 +556,11 @@ async def test_get_genres_drops_incomplete_genre_data(monkeypatch, httpx_mock: H
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         json=film_genres
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
+        url=TV_GENRES_URL,
         json=tv_genres
     )
 
@@ -481,18 +573,33 @@ async def test_get_genres_drops_incomplete_genre_data(monkeypatch, httpx_mock: H
     assert genre_names == {"Action", "Mystery"}
 
 
-@pytest.mark.asyncio
-async def test_get_genres_handles_empty_results(monkeypatch, httpx_mock: HTTPXMock):
-    """Test get_genres handles empty genre lists gracefully."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
+async def test_get_genres_treats_non_list_payload_as_empty(httpx_mock: HTTPXMock):
+    """Test that a genres payload that is not a list (e.g. null) yields no genres instead of raising."""
+    httpx_mock.add_response(
+        url=FILM_GENRES_URL,
+        json={"genres": None}
+    )
+    httpx_mock.add_response(
+        url=TV_GENRES_URL,
+        json={"genres": [{"id": 9648, "name": "Mystery"}]}
+    )
 
+    service = TMDBService()
+    result = await service.get_genres()
+
+    assert [g.name for g in result.genres] == ["Mystery"]
+    assert result.genres[0].has_films is False
+
+
+async def test_get_genres_handles_empty_results(httpx_mock: HTTPXMock):
+    """Test get_genres handles empty genre lists gracefully."""
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
-        json={"genres": []}
+        url=FILM_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
-        json={"genres": []}
+        url=TV_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
     )
 
     service = TMDBService()
@@ -501,19 +608,79 @@ async def test_get_genres_handles_empty_results(monkeypatch, httpx_mock: HTTPXMo
     assert result.genres == []
 
 
-@pytest.mark.asyncio
-async def test_get_genres_raises_api_response_error_on_http_error(monkeypatch, httpx_mock: HTTPXMock):
-    """Test that APIResponseError is raised when TMDB API returns HTTP error."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
+async def test_get_genres_reuses_cached_genres(httpx_mock: HTTPXMock):
+    """Test that repeated get_genres calls within the TTL are served without new requests."""
+    httpx_mock.add_response(
+        url=FILM_GENRES_URL,
+        json={"genres": [{"id": 28, "name": "Action"}]}
+    )
+    httpx_mock.add_response(
+        url=TV_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
+    )
+
+    service = TMDBService()
+    first = await service.get_genres()
+    second = await service.get_genres()
+
+    assert second == first
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_get_genres_force_refresh_bypasses_cache(httpx_mock: HTTPXMock):
+    """Test that force_refresh refetches both genre lists even within the TTL."""
+    httpx_mock.add_response(url=FILM_GENRES_URL, json={"genres": [{"id": 28, "name": "Action"}]})
+    httpx_mock.add_response(url=TV_GENRES_URL, json=EMPTY_GENRES_RESPONSE)
+    httpx_mock.add_response(url=FILM_GENRES_URL, json={"genres": [{"id": 28, "name": "Action & Adventure"}]})
+    httpx_mock.add_response(url=TV_GENRES_URL, json=EMPTY_GENRES_RESPONSE)
 
+    service = TMDBService()
+    await service.get_genres()
+    refreshed = await service.get_genres(force_refresh=True)
+
+    assert [genre.name for genre in refreshed.genres] == ["Action & Adventure"]
+    assert len(httpx_mock.get_requests()) == 4
+
+    # The refreshed responses replace the cached ones
+    assert await service.get_genres() == refreshed
+    assert len(httpx_mock.get_requests()) == 4
+
+
+async def test_get_genres_refetches_after_ttl_expires(monkeypatch, httpx_mock: HTTPXMock):
+    """Test that get_genres queries TMDB again once the cached list has expired."""
+    for _ in range(2):
+        httpx_mock.add_response(
+            url=FILM_GENRES_URL,
+            json={"genres": [{"id": 28, "name": "Action"}]}
+        )
+        httpx_mock.add_response(
+            url=TV_GENRES_URL,
+            json=EMPTY_GENRES_RESPONSE
+        )
+
+    # Drive the response cache from a fake clock
+    clock = [1000.0]
+    monkeypatch.setattr("greenroom.services.tmdb.cache.time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    service = TMDBService()
+    await service.get_genres()
+
+    clock[0] += TMDB_GENRES_CACHE_TTL + 1
+    await service.get_genres()
+
+    assert len(httpx_mock.get_requests()) == 4
+
+
+async def test_get_genres_raises_api_response_error_on_http_error(httpx_mock: HTTPXMock):
+    """Test that APIResponseError is raised when TMDB API returns HTTP error."""
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         status_code=401,
         text="Invalid API key"
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
-        json={"genres": []}
+        url=TV_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
     )
 
     service = TMDBService()
@@ -525,18 +692,15 @@ async def test_get_genres_raises_api_response_error_on_http_error(monkeypatch, h
     assert "401" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_genres_raises_api_response_error_on_invalid_json(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_genres_raises_api_response_error_on_invalid_json(httpx_mock: HTTPXMock):
     """Test that APIResponseError is raised when TMDB API returns invalid JSON."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         content=b"Not valid JSON!"
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
-        json={"genres": []}
+        url=TV_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
     )
 
     service = TMDBService()
@@ -547,18 +711,15 @@ async def test_get_genres_raises_api_response_error_on_invalid_json(monkeypatch,
     assert "invalid JSON" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_get_genres_raises_api_connection_error_on_request_failure(monkeypatch, httpx_mock: HTTPXMock):
+async def test_get_genres_raises_api_connection_error_on_request_failure(httpx_mock: HTTPXMock):
     """Test that APIConnectionError is raised when unable to connect to TMDB API."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     httpx_mock.add_exception(
         httpx.RequestError("Connection refused"),
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key"
+        url=FILM_GENRES_URL
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
-        json={"genres": []}
+        url=TV_GENRES_URL,
+        json=EMPTY_GENRES_RESPONSE
     )
 
     service = TMDBService()
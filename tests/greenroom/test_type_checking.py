@@ -1,19 +1,17 @@
 """Run mypy static type checker as part of the test suite."""
 
-import subprocess
-import sys
 from pathlib import Path
 
+from mypy import api
 
-def test_mypy():
+
+def test_mypy(monkeypatch):
     """Run mypy on src/greenroom/ and fail if any type errors are found."""
+    # mypy resolves its configuration and cache relative to the working directory
     project_root = Path(__file__).parent.parent.parent
-    result = subprocess.run(
-        [sys.executable, "-m", "mypy", "src/greenroom/"],
-        capture_output=True,
-        text=True,
-        cwd=project_root,
-    )
-    assert result.returncode == 0, (
-        f"mypy found type errors:\n{result.stdout}\n{result.stderr}"
+    monkeypatch.chdir(project_root)
+
+    stdout, stderr, exit_status = api.run(["src/greenroom/"])
+    assert exit_status == 0, (
+        f"mypy found type errors:\n{stdout}\n{stderr}"
     )
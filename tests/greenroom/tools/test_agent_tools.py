@@ -10,7 +10,6 @@ from greenroom.services.llm import LLMService
 from greenroom.tools.agent_tools import compare_llms
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_validates_empty_prompt():
     """Test that empty prompt raises ValueError."""
     mock_service = MagicMock(spec=LLMService)
@@ -20,7 +19,6 @@ async def test_compare_llms_validates_empty_prompt():
         await compare_llms(mock_service, mock_ctx, "")
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_validates_whitespace_prompt():
     """Test that whitespace-only prompt raises ValueError."""
     mock_service = MagicMock(spec=LLMService)
@@ -30,65 +28,40 @@ async def test_compare_llms_validates_whitespace_prompt():
         await compare_llms(mock_service, mock_ctx, "   ")
 
 
-@pytest.mark.asyncio
-async def test_compare_llms_validates_temperature():
-    """Test that invalid temperature raises ValueError."""
-    mock_service = MagicMock(spec=LLMService)
-    mock_ctx = MagicMock(spec=Context)
-
-    with pytest.raises(ValueError, match="Temperature must be between 0 and 2"):
-        await compare_llms(mock_service, mock_ctx, "Test", temperature=-0.1)
-
-    with pytest.raises(ValueError, match="Temperature must be between 0 and 2"):
-        await compare_llms(mock_service, mock_ctx, "Test", temperature=2.1)
-
-
-@pytest.mark.asyncio
-async def test_compare_llms_validates_max_tokens():
-    """Test that invalid max_tokens raises ValueError."""
-    mock_service = MagicMock(spec=LLMService)
-    mock_ctx = MagicMock(spec=Context)
-
-    with pytest.raises(ValueError, match="Max tokens must be between 1 and 4000"):
-        await compare_llms(mock_service, mock_ctx, "Test", max_tokens=0)
-
-    with pytest.raises(ValueError, match="Max tokens must be between 1 and 4000"):
-        await compare_llms(mock_service, mock_ctx, "Test", max_tokens=4001)
-
-
-@pytest.mark.asyncio
-async def test_compare_llms_accepts_boundary_temperature():
-    """Test that boundary temperatures (0 and 2) are accepted."""
+@pytest.mark.parametrize("temperature,valid", [(-0.1, False), (2.1, False), (0, True), (2, True)])
+async def test_compare_llms_temperature_bounds(temperature, valid):
+    """Test that temperatures outside 0-2 are rejected and the boundaries are accepted."""
     mock_ctx = MagicMock(spec=Context)
 
     mock_service = MagicMock(spec=LLMService)
     mock_service.resample_current_llm = AsyncMock(return_value="response")
     mock_service.generate_response_from_alternative_llm = AsyncMock(return_value="response")
 
-    result = await compare_llms(mock_service, mock_ctx, "Test", temperature=0)
-    assert result["prompt"] == "Test"
-
-    result = await compare_llms(mock_service, mock_ctx, "Test", temperature=2)
-    assert result["prompt"] == "Test"
+    if valid:
+        result = await compare_llms(mock_service, mock_ctx, "Test", temperature=temperature)
+        assert result["prompt"] == "Test"
+    else:
+        with pytest.raises(ValueError, match="Temperature must be between 0 and 2"):
+            await compare_llms(mock_service, mock_ctx, "Test", temperature=temperature)
 
 
-@pytest.mark.asyncio
-async def test_compare_llms_accepts_boundary_max_tokens():
-    """Test that boundary max_tokens (1 and 4000) are accepted."""
+@pytest.mark.parametrize("max_tokens,valid", [(0, False), (4001, False), (1, True), (4000, True)])
+async def test_compare_llms_max_tokens_bounds(max_tokens, valid):
+    """Test that max_tokens outside 1-4000 are rejected and the boundaries are accepted."""
     mock_ctx = MagicMock(spec=Context)
 
     mock_service = MagicMock(spec=LLMService)
     mock_service.resample_current_llm = AsyncMock(return_value="response")
     mock_service.generate_response_from_alternative_llm = AsyncMock(return_value="response")
 
-    result = await compare_llms(mock_service, mock_ctx, "Test", max_tokens=1)
-    assert result["prompt"] == "Test"
-
-    result = await compare_llms(mock_service, mock_ctx, "Test", max_tokens=4000)
-    assert result["prompt"] == "Test"
+    if valid:
+        result = await compare_llms(mock_service, mock_ctx, "Test", max_tokens=max_tokens)
+        assert result["prompt"] == "Test"
+    else:
+        with pytest.raises(ValueError, match="Max tokens must be between 1 and 4000"):
+            await compare_llms(mock_service, mock_ctx, "Test", max_tokens=max_tokens)
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_both_succeed():
     """Test that compare_llms correctly calls both LLMs and formats responses."""
     mock_ctx = MagicMock(spec=Context)
@@ -142,7 +115,6 @@ async def test_compare_llms_both_succeed():
     )
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_uses_default_params():
     """Test that default temperature and max_tokens are used when not specified."""
     mock_ctx = MagicMock(spec=Context)
@@ -166,7 +138,6 @@ async def test_compare_llms_uses_default_params():
 # --- Error handling ---
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_claude_fails_ollama_succeeds():
     """Test graceful degradation when Claude fails but Ollama succeeds."""
     mock_ctx = MagicMock(spec=Context)
@@ -193,7 +164,6 @@ async def test_compare_llms_claude_fails_ollama_succeeds():
     assert alt_resp["length"] == len("Ollama response")
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_ollama_fails_claude_succeeds():
     """Test graceful degradation when Ollama fails but Claude succeeds."""
     mock_ctx = MagicMock(spec=Context)
@@ -220,7 +190,6 @@ async def test_compare_llms_ollama_fails_claude_succeeds():
     assert alt_resp["length"] == 0
 
 
-@pytest.mark.asyncio
 async def test_compare_llms_both_fail():
     """Test that both errors are captured when both LLMs fail with different exception types."""
     mock_ctx = MagicMock(spec=Context)
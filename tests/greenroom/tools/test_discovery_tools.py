@@ -8,6 +8,9 @@ from greenroom.tools.discovery_tools import fetch_films, fetch_television
 from greenroom.models.media import Media, MediaList
 from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION
 
+EMPTY_MEDIA_LIST = MediaList(results=[], total_results=0, page=1, total_pages=0)
+
+
 @pytest.fixture
 def mock_media_service():
     """Create a mock media service."""
@@ -17,7 +20,7 @@ def mock_media_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_film_media_list():
     """Create sample film MediaList for testing."""
     return MediaList(
@@ -47,7 +50,7 @@ def sample_film_media_list():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_tv_media_list():
     """Create sample television MediaList for testing."""
     return MediaList(
@@ -70,7 +73,6 @@ def sample_tv_media_list():
 class TestFetchFilms:
     """Tests for fetch_films helper function."""
 
-    @pytest.mark.asyncio
     async def test_returns_formatted_results(self, mock_media_service, sample_film_media_list):
         """Test fetch_films returns correctly formatted results."""
         mock_media_service.get_media.return_value = sample_film_media_list
@@ -99,7 +101,6 @@ class TestFetchFilms:
         assert result["results"][1]["description"] is None
         assert result["results"][1]["genre_ids"] == []
 
-    @pytest.mark.asyncio
     async def test_uses_film_media_type_and_default_parameters(self, mock_media_service, sample_film_media_list):
         """Test fetch_films uses MEDIA_TYPE_FILM and passes default parameters."""
         mock_media_service.get_media.return_value = sample_film_media_list
@@ -116,7 +117,6 @@ class TestFetchFilms:
             max_results=20
         )
 
-    @pytest.mark.asyncio
     async def test_uses_film_media_type_with_custom_parameters(self, mock_media_service, sample_film_media_list):
         """Test fetch_films uses MEDIA_TYPE_FILM and passes custom parameters."""
         mock_media_service.get_media.return_value = sample_film_media_list
@@ -141,72 +141,9 @@ class TestFetchFilms:
             max_results=50
         )
 
-    @pytest.mark.asyncio
-    async def test_validates_year(self, mock_media_service, sample_film_media_list):
-        """Test fetch_films validates year parameter."""
-        with pytest.raises(ValueError, match="year must be 1900 or later"):
-            await fetch_films(mock_media_service, year=1899)
-
-        # Boundary: 1900 should be accepted
-        mock_media_service.get_media.return_value = sample_film_media_list
-        await fetch_films(mock_media_service, year=1900)
-
-    @pytest.mark.asyncio
-    async def test_validates_page(self, mock_media_service, sample_film_media_list):
-        """Test fetch_films validates page parameter."""
-        with pytest.raises(ValueError, match="page must be 1 or greater"):
-            await fetch_films(mock_media_service, page=0)
-        with pytest.raises(ValueError, match="page must be 1 or greater"):
-            await fetch_films(mock_media_service, page=-1)
-
-        # Boundary: 1 should be accepted
-        mock_media_service.get_media.return_value = sample_film_media_list
-        await fetch_films(mock_media_service, page=1)
-
-    @pytest.mark.asyncio
-    async def test_validates_max_results(self, mock_media_service, sample_film_media_list):
-        """Test fetch_films validates max_results parameter."""
-        with pytest.raises(ValueError, match="max_results must be between 1 and 100"):
-            await fetch_films(mock_media_service, max_results=0)
-        with pytest.raises(ValueError, match="max_results must be between 1 and 100"):
-            await fetch_films(mock_media_service, max_results=101)
-
-        # Boundaries: 1 and 100 should be accepted
-        mock_media_service.get_media.return_value = sample_film_media_list
-        await fetch_films(mock_media_service, max_results=1)
-        await fetch_films(mock_media_service, max_results=100)
-
-    @pytest.mark.asyncio
-    async def test_validates_language(self, mock_media_service, sample_film_media_list):
-        """Test fetch_films validates language parameter."""
-        with pytest.raises(ValueError, match="language must be a 2-character ISO 639-1 code"):
-            await fetch_films(mock_media_service, language="eng")
-        with pytest.raises(ValueError, match="language must be a 2-character ISO 639-1 code"):
-            await fetch_films(mock_media_service, language="e")
-        with pytest.raises(ValueError, match="language must be a 2-character ISO 639-1 code"):
-            await fetch_films(mock_media_service, language="12")
-
-        # Valid codes should be accepted
-        mock_media_service.get_media.return_value = sample_film_media_list
-        await fetch_films(mock_media_service, language="en")
-        await fetch_films(mock_media_service, language="fr")
-
-    @pytest.mark.asyncio
-    async def test_validates_sort_by(self, mock_media_service, sample_film_media_list):
-        """Test fetch_films validates sort_by parameter."""
-        with pytest.raises(ValueError, match="sort_by must be one of"):
-            await fetch_films(mock_media_service, sort_by="invalid_sort")
-
-        # Valid options should be accepted
-        mock_media_service.get_media.return_value = sample_film_media_list
-        await fetch_films(mock_media_service, sort_by="popularity.desc")
-        await fetch_films(mock_media_service, sort_by="date.asc")
-
-    @pytest.mark.asyncio
     async def test_empty_film_results(self, mock_media_service):
         """Test handling of empty results from service."""
-        empty_list = MediaList(results=[], total_results=0, page=1, total_pages=0)
-        mock_media_service.get_media.return_value = empty_list
+        mock_media_service.get_media.return_value = EMPTY_MEDIA_LIST
 
         result = await fetch_films(mock_media_service)
 
@@ -217,7 +154,6 @@ class TestFetchFilms:
 class TestFetchTelevision:
     """Tests for fetch_television helper function."""
 
-    @pytest.mark.asyncio
     async def test_returns_formatted_results(self, mock_media_service, sample_tv_media_list):
         """Test fetch_television returns correctly formatted results."""
         mock_media_service.get_media.return_value = sample_tv_media_list
@@ -238,7 +174,6 @@ class TestFetchTelevision:
         assert result["results"][0]["description"] == "TV Description 1"
         assert result["results"][0]["genre_ids"] == [18, 10765]
 
-    @pytest.mark.asyncio
     async def test_uses_television_media_type_and_default_parameters(self, mock_media_service, sample_tv_media_list):
         """Test fetch_television uses MEDIA_TYPE_TELEVISION and passes default parameters."""
         mock_media_service.get_media.return_value = sample_tv_media_list
@@ -255,7 +190,6 @@ class TestFetchTelevision:
             max_results=20
         )
 
-    @pytest.mark.asyncio
     async def test_uses_television_media_type_with_custom_parameters(self, mock_media_service, sample_tv_media_list):
         """Test fetch_television uses MEDIA_TYPE_TELEVISION and passes custom parameters."""
         mock_media_service.get_media.return_value = sample_tv_media_list
@@ -280,69 +214,55 @@ class TestFetchTelevision:
             max_results=75
         )
 
-    @pytest.mark.asyncio
-    async def test_validates_year(self, mock_media_service, sample_tv_media_list):
-        """Test fetch_television validates year parameter."""
-        with pytest.raises(ValueError, match="year must be 1900 or later"):
-            await fetch_television(mock_media_service, year=1899)
-
-        # Boundary: 1900 should be accepted
-        mock_media_service.get_media.return_value = sample_tv_media_list
-        await fetch_television(mock_media_service, year=1900)
-
-    @pytest.mark.asyncio
-    async def test_validates_page(self, mock_media_service, sample_tv_media_list):
-        """Test fetch_television validates page parameter."""
-        with pytest.raises(ValueError, match="page must be 1 or greater"):
-            await fetch_television(mock_media_service, page=0)
-        with pytest.raises(ValueError, match="page must be 1 or greater"):
-            await fetch_television(mock_media_service, page=-1)
-
-        # Boundary: 1 should be accepted
-        mock_media_service.get_media.return_value = sample_tv_media_list
-        await fetch_television(mock_media_service, page=1)
-
-    @pytest.mark.asyncio
-    async def test_validates_max_results(self, mock_media_service, sample_tv_media_list):
-        """Test fetch_television validates max_results parameter."""
-        with pytest.raises(ValueError, match="max_results must be between 1 and 100"):
-            await fetch_television(mock_media_service, max_results=0)
-        with pytest.raises(ValueError, match="max_results must be between 1 and 100"):
-            await fetch_television(mock_media_service, max_results=101)
-
-        # Boundaries: 1 and 100 should be accepted
-        mock_media_service.get_media.return_value = sample_tv_media_list
-        await fetch_television(mock_media_service, max_results=1)
-        await fetch_television(mock_media_service, max_results=100)
-
-    @pytest.mark.asyncio
-    async def test_validates_language(self, mock_media_service, sample_tv_media_list):
-        """Test fetch_television validates language parameter."""
-        with pytest.raises(ValueError, match="language must be a 2-character ISO 639-1 code"):
-            await fetch_television(mock_media_service, language="english")
-
-        # Valid codes should be accepted
-        mock_media_service.get_media.return_value = sample_tv_media_list
-        await fetch_television(mock_media_service, language="en")
-
-    @pytest.mark.asyncio
-    async def test_validates_sort_by(self, mock_media_service, sample_tv_media_list):
-        """Test fetch_television validates sort_by parameter."""
-        with pytest.raises(ValueError, match="sort_by must be one of"):
-            await fetch_television(mock_media_service, sort_by="name.asc")
-
-        # Valid options should be accepted
-        mock_media_service.get_media.return_value = sample_tv_media_list
-        await fetch_television(mock_media_service, sort_by="popularity.desc")
-
-    @pytest.mark.asyncio
     async def test_empty_television_results(self, mock_media_service):
         """Test handling of empty results from service."""
-        empty_list = MediaList(results=[], total_results=0, page=1, total_pages=0)
-        mock_media_service.get_media.return_value = empty_list
+        mock_media_service.get_media.return_value = EMPTY_MEDIA_LIST
 
         result = await fetch_television(mock_media_service)
 
         assert result["results"] == []
         assert result["total_results"] == 0
         assert result["total_pages"] == 0
+
+
+class TestParameterValidation:
+    """Tests for parameter validation shared by fetch_films and fetch_television."""
+
+    @pytest.mark.parametrize("fetch_fn", [fetch_films, fetch_television])
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"year": 1899}, "year must be 1900 or later"),
+        ({"page": 0}, "page must be 1 or greater"),
+        ({"page": -1}, "page must be 1 or greater"),
+        ({"max_results": 0}, "max_results must be between 1 and 100"),
+        ({"max_results": 101}, "max_results must be between 1 and 100"),
+        ({"language": "eng"}, "language must be a 2-character ISO 639-1 code"),
+        ({"language": "e"}, "language must be a 2-character ISO 639-1 code"),
+        ({"language": "12"}, "language must be a 2-character ISO 639-1 code"),
+        ({"language": "éa"}, "language must be a 2-character ISO 639-1 code"),
+        ({"sort_by": "invalid_sort"}, "sort_by must be one of"),
+    ])
+    async def test_rejects_invalid_parameters(self, mock_media_service, fetch_fn, kwargs, match):
+        """Test invalid parameters raise ValueError before the service is called."""
+        with pytest.raises(ValueError, match=match):
+            await fetch_fn(mock_media_service, **kwargs)
+
+        mock_media_service.get_media.assert_not_called()
+
+    @pytest.mark.parametrize("fetch_fn", [fetch_films, fetch_television])
+    @pytest.mark.parametrize("kwargs", [
+        {"year": 1900},
+        {"page": 1},
+        {"max_results": 1},
+        {"max_results": 100},
+        {"language": "en"},
+        {"language": "fr"},
+        {"sort_by": "popularity.desc"},
+        {"sort_by": "date.asc"},
+    ])
+    async def test_accepts_boundary_parameters(self, mock_media_service, fetch_fn, kwargs):
+        """Test boundary and valid parameter values are passed through to the service."""
+        mock_media_service.get_media.return_value = EMPTY_MEDIA_LIST
+
+        await fetch_fn(mock_media_service, **kwargs)
+
+        mock_media_service.get_media.assert_called_once()
@@ -1,8 +1,10 @@
 """Tests for genre tools. Service-level behavior is mocked."""
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
+import orjson
 
 from greenroom.tools.genre_tools import (
     fetch_genres,
@@ -10,14 +12,14 @@ from greenroom.tools.genre_tools import (
     categorize_all_genres,
 )
 from greenroom.models.genre import Genre, GenreList
-from greenroom.config import Mood
+from greenroom.services.mood_cache import MoodCache
+from greenroom.config import Mood, GENRE_CATEGORIZATION_BATCH_SIZE
 
 
 # =============================================================================
 # Test fetch_genres()
 # =============================================================================
 
-@pytest.mark.asyncio
 async def test_fetch_genres_transforms_genre_list_to_dict():
     """Test fetch_genres transforms GenreList to dict format correctly."""
     # Create a mock service that returns a GenreList
@@ -54,7 +56,6 @@ async def test_fetch_genres_transforms_genre_list_to_dict():
     mock_service.get_genres.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_fetch_genres_returns_empty_dict_for_empty_genre_list():
     """Test fetch_genres returns empty dict when service returns empty GenreList."""
     mock_service = MagicMock()
@@ -66,7 +67,6 @@ async def test_fetch_genres_returns_empty_dict_for_empty_genre_list():
     mock_service.get_genres.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_fetch_genres_uses_expected_keys():
     """Test fetch_genres uses expected string keys in genre property dicts."""
     mock_service = MagicMock()
@@ -100,7 +100,6 @@ SAMPLE_GENRES = {
 }
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_simplify_genres_calls_sample_with_correct_prompt(mock_fetch_genres):
     """Test that simplify_genres calls ctx.sample with the genre data."""
@@ -108,8 +107,8 @@ async def test_simplify_genres_calls_sample_with_correct_prompt(mock_fetch_genre
     mock_service = MagicMock()
 
     # Create mock Context with async sample method
-    mock_ctx, mock_response = MagicMock(), MagicMock()
-    mock_response.text = "Action, Drama, Mystery"
+    mock_ctx = MagicMock()
+    mock_response = SimpleNamespace(text="Action, Drama, Mystery")
     mock_ctx.sample = AsyncMock(return_value=mock_response)
 
     # Call the function
@@ -130,7 +129,6 @@ async def test_simplify_genres_calls_sample_with_correct_prompt(mock_fetch_genre
     assert result == "Action, Drama, Mystery"
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_simplify_genres_falls_back_on_sample_failure(mock_fetch_genres):
     """Test that simplify_genres falls back to sorted keys when sampling fails."""
@@ -155,7 +153,6 @@ async def test_simplify_genres_falls_back_on_sample_failure(mock_fetch_genres):
     assert "RuntimeError" in warning_msg
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_simplify_genres_handles_empty_genres(mock_fetch_genres):
     """Test that simplify_genres handles empty genre dict."""
@@ -163,8 +160,8 @@ async def test_simplify_genres_handles_empty_genres(mock_fetch_genres):
     mock_service = MagicMock()
 
     # Create mock Context with async sample method
-    mock_ctx, mock_response = MagicMock(), MagicMock()
-    mock_response.text = ""
+    mock_ctx = MagicMock()
+    mock_response = SimpleNamespace(text="")
     mock_ctx.sample = AsyncMock(return_value=mock_response)
 
     # Call the function
@@ -174,7 +171,6 @@ async def test_simplify_genres_handles_empty_genres(mock_fetch_genres):
     assert result == ""
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_simplify_genres_handles_malformed_llm_response(mock_fetch_genres):
     """Test that simplify_genres returns LLM response even if malformed."""
@@ -182,8 +178,8 @@ async def test_simplify_genres_handles_malformed_llm_response(mock_fetch_genres)
     mock_service = MagicMock()
 
     # Create mock Context with malformed LLM response
-    mock_ctx, mock_response = MagicMock(), MagicMock()
-    mock_response.text = "Here are the genres: Action, Drama, Mystery"  # Extra text
+    mock_ctx = MagicMock()
+    mock_response = SimpleNamespace(text="Here are the genres: Action, Drama, Mystery")  # Extra text
     mock_ctx.sample = AsyncMock(return_value=mock_response)
 
     result = await simplify_genres(mock_ctx, mock_service)
@@ -196,7 +192,6 @@ async def test_simplify_genres_handles_malformed_llm_response(mock_fetch_genres)
 # Test categorize_all_genres()
 # =============================================================================
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_categorize_all_genres_groups_genres_by_mood(mock_fetch_genres):
     """Test that categorize_all_genres correctly groups genres using hardcoded mappings."""
@@ -233,7 +228,6 @@ async def test_categorize_all_genres_groups_genres_by_mood(mock_fetch_genres):
     assert result == expected
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_categorize_all_genres_handles_empty_genres(mock_fetch_genres):
     """Test that categorize_all_genres handles empty genre dict."""
@@ -258,10 +252,9 @@ async def test_categorize_all_genres_handles_empty_genres(mock_fetch_genres):
     assert result == expected
 
 
-@pytest.mark.asyncio
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_categorize_all_genres_with_unknown_genres_uses_llm(mock_fetch_genres):
-    """Test that categorize_all_genres uses LLM for all unknown genres."""
+    """Test that categorize_all_genres categorizes all unknown genres with a single LLM call."""
     # Mock genre data with genres NOT in GENRE_MOOD_MAP
     genres_dict = {
         "Western": {"id": 37, "has_films": True, "has_tv_shows": False},
@@ -271,27 +264,22 @@ async def test_categorize_all_genres_with_unknown_genres_uses_llm(mock_fetch_gen
     mock_fetch_genres.return_value = genres_dict
     mock_service = MagicMock()
 
-    # Create mock Context with sample returning different moods for each genre
-    # Note: Genres are processed in sorted order: Experimental, Noir, Western
+    # Create mock Context with one sample response covering every unknown genre
     mock_ctx = MagicMock()
-    mock_responses = [
-        MagicMock(text="Dark"),     # Experimental -> Dark
-        MagicMock(text="Dark"),     # Noir -> Dark
-        MagicMock(text="Fun"),      # Western -> Fun
-    ]
-    mock_ctx.sample = AsyncMock(side_effect=mock_responses)
+    mock_response = SimpleNamespace(text='{"Experimental": "Dark", "Noir": "Dark", "Western": "Fun"}')
+    mock_ctx.sample = AsyncMock(return_value=mock_response)
 
     # Call function
     result = await categorize_all_genres(mock_ctx, mock_service)
 
-    # Verify LLM was called for each unknown genre (3 times)
-    assert mock_ctx.sample.call_count == 3
+    # Verify LLM was called once for all unknown genres
+    mock_ctx.sample.assert_called_once()
 
-    # Verify each call includes the genre name in the prompt
-    call_args_list = mock_ctx.sample.call_args_list
-    assert "Experimental" in call_args_list[0].kwargs["messages"]
-    assert "Noir" in call_args_list[1].kwargs["messages"]
-    assert "Western" in call_args_list[2].kwargs["messages"]
+    # Verify the prompt includes every unknown genre name
+    messages = mock_ctx.sample.call_args.kwargs["messages"]
+    assert "Experimental" in messages
+    assert "Noir" in messages
+    assert "Western" in messages
 
     # Verify genres are categorized according to LLM responses
     expected = {
@@ -304,7 +292,89 @@ async def test_categorize_all_genres_with_unknown_genres_uses_llm(mock_fetch_gen
     assert result == expected
 
 
-@pytest.mark.asyncio
+@patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
+async def test_categorize_all_genres_batches_unknown_genres(mock_fetch_genres):
+    """Test that categorize_all_genres probes with one batch, then samples the remaining batches concurrently."""
+    genre_names = [f"Unknown {i:02d}" for i in range(2 * GENRE_CATEGORIZATION_BATCH_SIZE + 5)]
+    mock_fetch_genres.return_value = {
+        name: {"id": i, "has_films": True, "has_tv_shows": False} for i, name in enumerate(genre_names)
+    }
+    mock_service = MagicMock()
+
+    # Create mock Context whose LLM labels every genre it is asked about as Dark
+    in_flight = 0
+    max_in_flight = 0
+
+    async def sample(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        requested = [name for name in genre_names if name in kwargs["messages"]]
+        return SimpleNamespace(text=orjson.dumps(dict.fromkeys(requested, "Dark")).decode())
+
+    mock_ctx = MagicMock()
+    mock_ctx.sample = AsyncMock(side_effect=sample)
+
+    # Call function
+    result = await categorize_all_genres(mock_ctx, mock_service)
+
+    # Verify two full batches plus one partial batch; the last two are sampled concurrently
+    assert mock_ctx.sample.call_count == 3
+    assert max_in_flight == 2
+    assert result[Mood.DARK.value] == genre_names
+    assert result[Mood.OTHER.value] == []
+
+
+@patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
+async def test_categorize_all_genres_reuses_cached_llm_moods(mock_fetch_genres, tmp_path):
+    """Test that LLM moods are stored in the mood cache and reused instead of sampling again."""
+    mock_fetch_genres.return_value = {
+        "Western": {"id": 37, "has_films": True, "has_tv_shows": False},
+        "Noir": {"id": 10001, "has_films": False, "has_tv_shows": True},
+    }
+    mock_service = MagicMock()
+    mood_cache = MoodCache(tmp_path / "moods.sqlite")
+    mood_cache.open()
+
+    mock_ctx = MagicMock()
+    mock_ctx.sample = AsyncMock(return_value=SimpleNamespace(text='{"Noir": "Dark", "Western": "Fun"}'))
+
+    # First call asks the LLM and populates the cache
+    first = await categorize_all_genres(mock_ctx, mock_service, mood_cache)
+    assert mock_ctx.sample.call_count == 1
+
+    # Second call is served entirely from the cache
+    second = await categorize_all_genres(mock_ctx, mock_service, mood_cache)
+    assert mock_ctx.sample.call_count == 1
+    assert second == first
+    assert second[Mood.DARK.value] == ["Noir"]
+    assert second[Mood.FUN.value] == ["Western"]
+    mood_cache.close()
+
+
+@patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
+async def test_categorize_all_genres_does_not_cache_other_moods(mock_fetch_genres, tmp_path):
+    """Test that an LLM answer of Other is used but not cached, so the genre is asked about again."""
+    mock_fetch_genres.return_value = {
+        "Western": {"id": 37, "has_films": True, "has_tv_shows": False},
+        "Noir": {"id": 10001, "has_films": False, "has_tv_shows": True},
+    }
+    mock_service = MagicMock()
+    mood_cache = MoodCache(tmp_path / "moods.sqlite")
+    mood_cache.open()
+
+    mock_ctx = MagicMock()
+    mock_ctx.sample = AsyncMock(return_value=SimpleNamespace(text='{"Noir": "Dark", "Western": "Other"}'))
+
+    result = await categorize_all_genres(mock_ctx, mock_service, mood_cache)
+
+    assert result[Mood.OTHER.value] == ["Western"]
+    assert mood_cache.get_many(["Noir", "Western"]) == {"Noir": "Dark"}
+    mood_cache.close()
+
+
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_categorize_all_genres_falls_back_to_other_when_llm_fails(mock_fetch_genres):
     """Test that categorize_all_genres places unknown genres in Other when LLM fails."""
@@ -324,11 +394,11 @@ async def test_categorize_all_genres_falls_back_to_other_when_llm_fails(mock_fet
     # Call function
     result = await categorize_all_genres(mock_ctx, mock_service)
 
-    # Verify LLM was attempted for each unknown genre
-    assert mock_ctx.sample.call_count == 2
+    # Verify LLM was attempted once for all unknown genres
+    assert mock_ctx.sample.call_count == 1
 
-    # Verify warning was logged for each failure
-    assert mock_ctx.warning.call_count == 2
+    # Verify warning was logged for the failure
+    assert mock_ctx.warning.call_count == 1
 
     # Verify all unknown genres are placed in Other category
     expected = {
@@ -341,7 +411,29 @@ async def test_categorize_all_genres_falls_back_to_other_when_llm_fails(mock_fet
     assert result == expected
 
 
-@pytest.mark.asyncio
+@patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
+async def test_categorize_all_genres_stops_sampling_when_llm_unavailable(mock_fetch_genres):
+    """Test that categorize_all_genres skips remaining batches after the first sampling call fails."""
+    genre_names = [f"Unknown {i:02d}" for i in range(2 * GENRE_CATEGORIZATION_BATCH_SIZE + 5)]
+    mock_fetch_genres.return_value = {
+        name: {"id": i, "has_films": True, "has_tv_shows": False} for i, name in enumerate(genre_names)
+    }
+    mock_service = MagicMock()
+
+    # Create mock Context where sample raises exception (LLM unavailable)
+    mock_ctx = MagicMock()
+    mock_ctx.sample = AsyncMock(side_effect=RuntimeError("Sampling not supported"))
+    mock_ctx.warning = AsyncMock()
+
+    # Call function
+    result = await categorize_all_genres(mock_ctx, mock_service)
+
+    # Verify only the probe batch was sampled and a single warning was logged
+    assert mock_ctx.sample.call_count == 1
+    assert mock_ctx.warning.call_count == 1
+    assert result[Mood.OTHER.value] == genre_names
+
+
 @patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
 async def test_categorize_all_genres_falls_back_to_other_on_invalid_llm_response(mock_fetch_genres):
     """Test that categorize_all_genres places genres in Other when LLM returns invalid mood."""
@@ -354,8 +446,7 @@ async def test_categorize_all_genres_falls_back_to_other_on_invalid_llm_response
 
     # Create mock Context with invalid LLM response
     mock_ctx = MagicMock()
-    mock_response = MagicMock()
-    mock_response.text = "InvalidMood"  # Not one of the four valid moods
+    mock_response = SimpleNamespace(text='{"Experimental": "InvalidMood"}')  # Not one of the four valid moods
     mock_ctx.sample = AsyncMock(return_value=mock_response)
 
     # Call function
@@ -370,3 +461,33 @@ async def test_categorize_all_genres_falls_back_to_other_on_invalid_llm_response
         Mood.OTHER.value: ["Experimental"]
     }
     assert result == expected
+
+
+@patch('greenroom.tools.genre_tools.fetch_genres', new_callable=AsyncMock)
+async def test_categorize_all_genres_falls_back_to_other_on_non_json_llm_response(mock_fetch_genres):
+    """Test that categorize_all_genres places genres in Other and warns when LLM response is not JSON."""
+    genres_dict = {
+        "Experimental": {"id": 9999, "has_films": True, "has_tv_shows": True},
+        "Horror": {"id": 27, "has_films": True, "has_tv_shows": False},
+    }
+    mock_fetch_genres.return_value = genres_dict
+    mock_service = MagicMock()
+
+    # Create mock Context whose LLM ignores the requested JSON format
+    mock_ctx = MagicMock()
+    mock_ctx.sample = AsyncMock(return_value=SimpleNamespace(text="Dark"))
+    mock_ctx.warning = AsyncMock()
+
+    # Call function
+    result = await categorize_all_genres(mock_ctx, mock_service)
+
+    # Verify the failure was logged and known genres still use hardcoded mappings
+    mock_ctx.warning.assert_called_once()
+    expected = {
+        Mood.DARK.value: ["Horror"],
+        Mood.LIGHT.value: [],
+        Mood.SERIOUS.value: [],
+        Mood.FUN.value: [],
+        Mood.OTHER.value: ["Experimental"]
+    }
+    assert result == expected
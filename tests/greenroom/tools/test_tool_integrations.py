@@ -7,23 +7,37 @@ from greenroom.services.tmdb.service import TMDBService
 from greenroom.models.media_types import MEDIA_TYPE_FILM, MEDIA_TYPE_TELEVISION
 from greenroom.tools.genre_tools import fetch_genres
 
+FILM_GENRES_URL = "https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key"
+TV_GENRES_URL = "https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key"
 
-@pytest.mark.asyncio
-async def test_discover_films_with_genre_from_list_genres(monkeypatch, httpx_mock: HTTPXMock):
-    """Use genre ID from genre tools to discover specific films with media discovery tools."""
+
+def discover_url(endpoint: str, genre_id: int) -> str:
+    """Build the default TMDB discover URL for one genre."""
+    return (
+        f"https://api.themoviedb.org/3/discover/{endpoint}?api_key=test_api_key"
+        f"&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres={genre_id}"
+    )
+
+
+@pytest.fixture(autouse=True)
+def tmdb_api_key(monkeypatch):
+    """Configure a fake TMDB API key for every test."""
     monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
 
+
+async def test_discover_films_with_genre_from_list_genres(httpx_mock: HTTPXMock):
+    """Use genre ID from genre tools to discover specific films with media discovery tools."""
     # Mock list_genres response
     genre_response = {
         "genres": [{"id": 28, "name": "Action"}]
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         json=genre_response
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
+        url=TV_GENRES_URL,
         json={"genres": []}
     )
 
@@ -45,7 +59,7 @@ async def test_discover_films_with_genre_from_list_genres(monkeypatch, httpx_moc
     }
 
     httpx_mock.add_response(
-        url=f"https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres={action_id}",
+        url=discover_url("movie", action_id),
         json=discovery_response
     )
 
@@ -57,22 +71,19 @@ async def test_discover_films_with_genre_from_list_genres(monkeypatch, httpx_moc
     assert action_id in result.results[0].genre_ids
 
 
-@pytest.mark.asyncio
-async def test_discover_television_with_genre_from_list_genres(monkeypatch, httpx_mock: HTTPXMock):
+async def test_discover_television_with_genre_from_list_genres(httpx_mock: HTTPXMock):
     """Use genre ID from genre tools to discover specific tv shows with media discovery tools."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     # Mock list_genres response with Drama genre available for both films and TV
     genre_response = {
         "genres": [{"id": 18, "name": "Drama"}]
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         json=genre_response
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
+        url=TV_GENRES_URL,
         json=genre_response
     )
 
@@ -94,7 +105,7 @@ async def test_discover_television_with_genre_from_list_genres(monkeypatch, http
     }
 
     httpx_mock.add_response(
-        url=f"https://api.themoviedb.org/3/discover/tv?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres={drama_id}",
+        url=discover_url("tv", drama_id),
         json=discovery_response
     )
 
@@ -107,22 +118,19 @@ async def test_discover_television_with_genre_from_list_genres(monkeypatch, http
     assert drama_id in result.results[0].genre_ids
 
 
-@pytest.mark.asyncio
-async def test_discover_films_and_television_with_shared_genre(monkeypatch, httpx_mock: HTTPXMock):
+async def test_discover_films_and_television_with_shared_genre(httpx_mock: HTTPXMock):
     """Discover both films and TV shows with the same shared genre ID."""
-    monkeypatch.setenv("TMDB_API_KEY", "test_api_key")
-
     # Mock list_genres response with Drama genre available for both films and TV
     genre_response = {
         "genres": [{"id": 18, "name": "Drama"}]
     }
 
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/movie/list?api_key=test_api_key",
+        url=FILM_GENRES_URL,
         json=genre_response
     )
     httpx_mock.add_response(
-        url="https://api.themoviedb.org/3/genre/tv/list?api_key=test_api_key",
+        url=TV_GENRES_URL,
         json=genre_response
     )
 
@@ -146,7 +154,7 @@ async def test_discover_films_and_television_with_shared_genre(monkeypatch, http
     }
 
     httpx_mock.add_response(
-        url=f"https://api.themoviedb.org/3/discover/movie?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres={drama_id}",
+        url=discover_url("movie", drama_id),
         json=film_discovery_response
     )
 
@@ -161,7 +169,7 @@ async def test_discover_films_and_television_with_shared_genre(monkeypatch, http
     }
 
     httpx_mock.add_response(
-        url=f"https://api.themoviedb.org/3/discover/tv?api_key=test_api_key&sort_by=popularity.desc&page=1&include_adult=false&include_video=false&with_genres={drama_id}",
+        url=discover_url("tv", drama_id),
         json=tv_discovery_response
     )
 